@@ -4,123 +4,404 @@ Build script for creating standalone executables of Survival Curve Extractor
 """
 
 import os
+import json
 import sys
 import subprocess
 import platform
 import shutil
+import time
+import hashlib
+import stat
+import tarfile
+import zipfile
+import zlib
+import argparse
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def clean_build_dirs():
+# Platform details never change during a build, so look them up once
+SYSTEM = platform.system()
+MACHINE = platform.machine()
+
+def force_clean_requested(args=None):
+    """Check whether a fresh (non-incremental) build was requested"""
+    return bool(os.environ.get('FORCE_CLEAN')) or bool(args and args.fresh)
+
+def clean_build_dirs(fresh=False):
     """Clean previous build directories"""
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            print(f"Cleaning {dir_name}...")
-            shutil.rmtree(dir_name)
-    
-    # Clean .spec file if it exists
-    spec_files = list(Path('.').glob('*.spec'))
-    for spec_file in spec_files:
-        if spec_file.name != 'survival_curve_extractor.spec':
-            print(f"Removing {spec_file}...")
-            spec_file.unlink()
-
-def build_executable():
-    """Build the executable using PyInstaller"""
-    system = platform.system()
-    print(f"Building for {system}...")
-    
-    # Use poetry run to ensure we're using the right environment
-    cmd = [
-        'poetry', 'run', 'pyinstaller',
-        '--clean',
-        '--noconfirm',
-        'survival_curve_extractor.spec'
+    # PyInstaller's build/ directory holds its analysis cache, so keep it
+    # unless a fresh build was explicitly requested
+    dirs_to_clean = {'dist', '__pycache__'}
+    if fresh:
+        dirs_to_clean.add('build')
+    
+    # Classify everything in a single directory read
+    dirs_to_remove = []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name in dirs_to_clean and entry.is_dir(follow_symlinks=False):
+                print(f"Cleaning {entry.name}...")
+                dirs_to_remove.append(entry.path)
+            elif (entry.name.endswith('.spec') and entry.is_file()
+                  and entry.name != 'survival_curve_extractor.spec'):
+                # Clean stray .spec files generated by ad-hoc PyInstaller runs
+                print(f"Removing {entry.name}...")
+                os.unlink(entry.path)
+    
+    for path in dirs_to_remove:
+        fast_rmtree(path)
+
+def fast_rmtree(root, max_workers=32):
+    """Remove a directory tree, unlinking its files in parallel"""
+    # Deleting many small files is bound by per-file unlink latency, not
+    # throughput, so issue the unlinks concurrently and then remove the
+    # (now empty) directories bottom-up
+    files = []
+    dirs = []
+    for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+        files.extend(os.path.join(dirpath, name) for name in filenames)
+        for name in dirnames:
+            # os.walk does not descend into symlinked dirs; unlink the link itself
+            path = os.path.join(dirpath, name)
+            if os.path.islink(path):
+                files.append(path)
+        dirs.append(dirpath)
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(os.unlink, files))
+    for path in dirs:
+        os.rmdir(path)
+
+BUILD_HASH_FILE = Path('dist') / '.build_hash'
+
+def build_input_files():
+    """List the files whose contents determine the build output"""
+    return sorted(Path('.').glob('*.py')) + [
+        Path('survival_curve_extractor.spec'), Path('pyproject.toml'), Path('poetry.lock')
     ]
+
+def inputs_hash(compress=False, no_upx=False):
+    """Hash every input that affects the build output"""
+    # A fast non-cryptographic use: this is only a cache key
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{sys.version}|{SYSTEM}|{MACHINE}|compress={compress}|no_upx={no_upx}".encode())
+    # Stream through one reusable buffer instead of reading whole files
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
+    for path in build_input_files():
+        if path.exists():
+            h.update(path.name.encode())
+            with open(path, 'rb', buffering=0) as f:
+                while n := f.readinto(buf):
+                    h.update(view[:n])
+    return h.hexdigest()
+
+def is_build_cached(build_hash):
+    """Check whether dist/ already holds a build for these exact inputs"""
+    try:
+        return BUILD_HASH_FILE.read_text().strip() == build_hash
+    except OSError:
+        return False
+
+def build_executable(fresh=False, no_upx=False):
+    """Build the executable using PyInstaller"""
+    print(f"Building for {SYSTEM}...")
+    
+    # Run PyInstaller from the current interpreter when it is installed here
+    # (e.g. under `poetry run python build.py`); only fall back to spawning
+    # Poetry to locate the right environment when it isn't
+    if importlib.util.find_spec('PyInstaller') is not None:
+        cmd = [sys.executable, '-m', 'PyInstaller']
+    else:
+        cmd = ['poetry', 'run', 'pyinstaller']
+    cmd += ['--noconfirm', 'survival_curve_extractor.spec']
+    
+    # Reuse PyInstaller's cached analysis unless a fresh build was requested
+    if fresh:
+        cmd.append('--clean')
+    
+    # Point PyInstaller at a stable, project-local config dir so its binary
+    # cache survives between runs and isn't shared across platforms/arches
+    cache_dir = Path('.pyinstaller-cache') / f"{SYSTEM}-{MACHINE}"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    env = os.environ.copy()
+    env['PYINSTALLER_CONFIG_DIR'] = str(cache_dir.resolve())
+    # The spec reads this; PyInstaller rejects --noupx alongside a spec file
+    if no_upx:
+        env['SCE_NO_UPX'] = '1'
     
     print("Running:", ' '.join(cmd))
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    # Inherit stdio so PyInstaller's log streams straight to the terminal
+    result = subprocess.run(cmd, env=env, check=False)
     
     if result.returncode != 0:
-        print("Error building executable:")
-        print(result.stderr)
+        print(f"Build failed (exit {result.returncode})")
         return False
     
     print("Build successful!")
     return True
 
-def create_distribution():
+def add_to_zip(zf, source_path):
+    """Add a file or directory tree to an open zip archive"""
+    source_path = Path(source_path)
+    base_dir = source_path.parent
+    
+    def add_entry(path):
+        arcname = path.relative_to(base_dir).as_posix()
+        if path.is_symlink():
+            # Store symlinks as links (as `zip -y` does) so .app bundles stay intact
+            info = zipfile.ZipInfo(arcname)
+            info.create_system = 3  # Unix, so external_attr is honoured on extract
+            info.external_attr = (stat.S_IFLNK | 0o777) << 16
+            zf.writestr(info, os.readlink(path))
+        else:
+            # ZipFile.write keeps the file mode, including executable bits
+            zf.write(path, arcname)
+    
+    if source_path.is_dir() and not source_path.is_symlink():
+        for root, dirs, files in os.walk(source_path):
+            root_path = Path(root)
+            for name in sorted(dirs):
+                dir_path = root_path / name
+                if dir_path.is_symlink():
+                    add_entry(dir_path)
+            for name in sorted(files):
+                add_entry(root_path / name)
+    else:
+        add_entry(source_path)
+
+def create_zip(archive_path, source_path, compress=False):
+    """Package a build artifact into a zip archive"""
+    # PyInstaller payloads are already compressed, so store by default; when
+    # compression is requested, the fastest level is several times quicker than the
+    # default level 6 for almost the same ratio on this kind of input
+    if compress:
+        zf = zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=zlib.Z_BEST_SPEED)
+    else:
+        zf = zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED)
+    with zf:
+        add_to_zip(zf, source_path)
+
+def create_tar_zst(archive_path, source_path):
+    """Package a build artifact into a zstd-compressed tarball"""
+    zstd = shutil.which('zstd')
+    if not zstd:
+        raise RuntimeError("zstd not found on PATH (install it or use --compress=deflate)")
+    
+    # Stream the tar straight into zstd: multi-threaded, long-range matching
+    proc = subprocess.Popen([zstd, '-T0', '--long', '-q', '-f', '-o', str(archive_path)],
+                            stdin=subprocess.PIPE)
+    try:
+        with tarfile.open(fileobj=proc.stdin, mode='w|') as tf:
+            tf.add(source_path, arcname=Path(source_path).name)
+    finally:
+        proc.stdin.close()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise RuntimeError(f"zstd failed (exit {returncode})")
+
+def create_archive(dist_dir, source_path, label, compress='none'):
+    """Package a build artifact for distribution"""
+    if compress == 'zstd':
+        archive_path = dist_dir / f'SurvivalCurveExtractor-{label}-{MACHINE}.tar.zst'
+        print(f"Creating {archive_path.name}...")
+        create_tar_zst(archive_path, source_path)
+    else:
+        archive_path = dist_dir / f'SurvivalCurveExtractor-{label}-{MACHINE}.zip'
+        print(f"Creating {archive_path.name}...")
+        create_zip(archive_path, source_path, compress == 'deflate')
+    print(f"Distribution package created: dist/{archive_path.name}")
+    return archive_path
+
+def file_sha256(path):
+    """Compute the SHA-256 checksum of a file"""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+def tree_size(path):
+    """Total size in bytes of a file or directory tree (symlinks not followed)"""
+    path = Path(path)
+    if not path.is_dir() or path.is_symlink():
+        return path.lstat().st_size
+    total = 0
+    for root, dirs, files in os.walk(path):
+        for name in files:
+            total += os.lstat(os.path.join(root, name)).st_size
+    return total
+
+def run_task_graph(tasks):
+    """Run (name, fn, deps) tasks concurrently; each fn receives its deps' results"""
+    # Tasks must be listed in dependency order. Every task gets its own
+    # worker, so blocking on a dependency's future can never starve the pool
+    futures = {}
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        for name, fn, deps in tasks:
+            dep_futures = [futures[dep] for dep in deps]
+            futures[name] = executor.submit(
+                lambda fn=fn, dep_futures=dep_futures: fn(*[f.result() for f in dep_futures])
+            )
+        return {name: future.result() for name, future in futures.items()}
+
+def package_artifact(dist_dir, source_path, label, compress='none'):
+    """Archive a build artifact and write its checksum manifest"""
+    def write_manifest(archive_path, archive_sha256, artifact_size):
+        manifest = {
+            'archive': archive_path.name,
+            'sha256': archive_sha256,
+            'archive_size': archive_path.stat().st_size,
+            'artifact_size': artifact_size,
+            'platform': SYSTEM,
+            'machine': MACHINE,
+        }
+        manifest_path = archive_path.with_name(archive_path.name + '.manifest.json')
+        manifest_path.write_text(json.dumps(manifest, indent=2))
+        print(f"SHA-256: {archive_sha256}")
+        return manifest_path
+    
+    # Measuring the artifact overlaps with archiving; checksum and manifest
+    # wait for the archive
+    return run_task_graph([
+        ('archive', lambda: create_archive(dist_dir, source_path, label, compress), []),
+        ('size', lambda: tree_size(source_path), []),
+        ('sha256', file_sha256, ['archive']),
+        ('manifest', write_manifest, ['archive', 'sha256', 'size']),
+    ])
+
+def dist_macos(dist_dir, compress='none'):
+    """Package the macOS application bundle"""
+    app_path = dist_dir / 'SurvivalCurveExtractor.app'
+    if app_path.exists():
+        # Create a DMG file (optional, requires additional tools)
+        print(f"Application bundle created at: {app_path}")
+        package_artifact(dist_dir, app_path, 'macOS', compress)
+
+def dist_windows(dist_dir, compress='none'):
+    """Package the Windows executable"""
+    exe_path = dist_dir / 'SurvivalCurveExtractor.exe'
+    if exe_path.exists():
+        print(f"Executable created at: {exe_path}")
+        package_artifact(dist_dir, exe_path, 'Windows', compress)
+
+def dist_linux(dist_dir, compress='none'):
+    """Package the Linux executable"""
+    exe_path = dist_dir / 'SurvivalCurveExtractor'
+    if exe_path.exists():
+        print(f"Executable created at: {exe_path}")
+        package_artifact(dist_dir, exe_path, 'Linux', compress)
+
+DIST_HANDLERS = {
+    'Darwin': dist_macos,
+    'Windows': dist_windows,
+    'Linux': dist_linux,
+}
+
+def create_distribution(compress='none'):
     """Create a distribution package"""
-    system = platform.system()
-    dist_dir = Path('dist')
-    
-    if system == 'Darwin':  # macOS
-        app_path = dist_dir / 'SurvivalCurveExtractor.app'
-        if app_path.exists():
-            # Create a DMG file (optional, requires additional tools)
-            print(f"Application bundle created at: {app_path}")
-            
-            # Create a simple zip file for distribution
-            zip_name = f'SurvivalCurveExtractor-macOS-{platform.machine()}.zip'
-            print(f"Creating {zip_name}...")
-            subprocess.run(['zip', '-r', zip_name, 'SurvivalCurveExtractor.app'], 
-                         cwd=dist_dir, check=True)
-            print(f"Distribution package created: dist/{zip_name}")
-    
-    elif system == 'Windows':
-        exe_path = dist_dir / 'SurvivalCurveExtractor.exe'
-        if exe_path.exists():
-            print(f"Executable created at: {exe_path}")
-            
-            # Create a zip file for distribution
-            zip_name = f'SurvivalCurveExtractor-Windows-{platform.machine()}.zip'
-            print(f"Creating {zip_name}...")
-            
-            # On Windows, we might not have zip command, use Python's zipfile
-            import zipfile
-            with zipfile.ZipFile(dist_dir / zip_name, 'w', zipfile.ZIP_DEFLATED) as zf:
-                zf.write(exe_path, 'SurvivalCurveExtractor.exe')
-            
-            print(f"Distribution package created: dist/{zip_name}")
+    DIST_HANDLERS.get(SYSTEM, dist_linux)(Path('dist'), compress)
+
+def run_build(args, fresh=False):
+    """Run one complete build and packaging pass"""
+    # Skip the whole build when nothing has changed since the last one
+    build_hash = inputs_hash(args.compress, args.no_upx)
+    if not fresh and is_build_cached(build_hash):
+        print("Inputs unchanged since last build (cache hit) - nothing to do.")
+        return True
+    
+    # Clean previous builds
+    clean_build_dirs(fresh)
+    
+    # Build the executable
+    if not build_executable(fresh, args.no_upx):
+        print("\nBuild failed!")
+        return False
     
-    else:  # Linux
-        exe_path = dist_dir / 'SurvivalCurveExtractor'
-        if exe_path.exists():
-            print(f"Executable created at: {exe_path}")
+    # Create distribution package
+    try:
+        create_distribution(args.compress)
+    except (OSError, RuntimeError) as e:
+        print(f"\nPackaging failed: {e}")
+        return False
+    BUILD_HASH_FILE.write_text(build_hash)
+    
+    print("\nBuild completed successfully!")
+    print("\nTo run the application:")
+    
+    if SYSTEM == 'Darwin':
+        print("  - Double-click dist/SurvivalCurveExtractor.app")
+        print("  - Or run: open dist/SurvivalCurveExtractor.app")
+    elif SYSTEM == 'Windows':
+        print("  - Double-click dist/SurvivalCurveExtractor.exe")
+    else:
+        print("  - Run: ./dist/SurvivalCurveExtractor")
+    return True
+
+def input_mtimes():
+    """Snapshot the modification times of the build inputs"""
+    return {path: path.stat().st_mtime_ns for path in build_input_files() if path.exists()}
+
+def watch_and_build(args, fresh=False, poll_interval=0.5):
+    """Rebuild whenever a build input changes, until interrupted"""
+    # Staying in one process keeps the interpreter warm, and PyInstaller's
+    # cache makes each rebuild incremental
+    def rebuild(fresh=False):
+        # A failed build (missing tool, unexpected error) must not end the watch
+        try:
+            run_build(args, fresh)
+        except Exception as e:
+            print(f"\nBuild raised {type(e).__name__}: {e}")
+    
+    # Snapshot first, so an input saved during the (slowest) first build still triggers a rebuild
+    snapshot = input_mtimes()
+    rebuild(fresh)
+    print("\nWatching for changes (Ctrl+C to stop)...")
+    try:
+        while True:
+            time.sleep(poll_interval)
+            current = input_mtimes()
+            if current == snapshot:
+                continue
             
-            # Create a tar.gz file for distribution
-            tar_name = f'SurvivalCurveExtractor-Linux-{platform.machine()}.tar.gz'
-            print(f"Creating {tar_name}...")
-            subprocess.run(['tar', '-czf', tar_name, 'SurvivalCurveExtractor'], 
-                         cwd=dist_dir, check=True)
-            print(f"Distribution package created: dist/{tar_name}")
+            # Wait for the inputs to settle so a burst of saves triggers one build
+            while current != snapshot:
+                snapshot = current
+                time.sleep(poll_interval)
+                current = input_mtimes()
+            
+            print("\nChange detected, rebuilding...")
+            rebuild()
+            print("\nWatching for changes (Ctrl+C to stop)...")
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
 
 def main():
+    parser = argparse.ArgumentParser(description="Build Survival Curve Extractor")
+    parser.add_argument('--fresh', action='store_true',
+                        help="Discard PyInstaller's cache and rebuild from scratch (same as FORCE_CLEAN=1)")
+    parser.add_argument('--compress', nargs='?', const='deflate', default='none',
+                        choices=['none', 'deflate', 'zstd'],
+                        help="Compress the distribution archive: 'deflate' (fast level zip, the default "
+                             "when no value is given) or 'zstd' (multi-threaded .tar.zst, needs zstd on PATH). "
+                             "Files are stored uncompressed otherwise.")
+    parser.add_argument('--no-upx', action='store_true',
+                        help="Skip UPX compression of the bundled binaries: a noticeably faster build, "
+                             "but a larger executable")
+    parser.add_argument('--watch', action='store_true',
+                        help="Keep running and rebuild whenever a source file, the spec or the lockfile changes")
+    args = parser.parse_args()
+    fresh = force_clean_requested(args)
+    
     print("Survival Curve Extractor Build Script")
     print("=" * 50)
     
-    # Clean previous builds
-    clean_build_dirs()
-    
-    # Build the executable
-    if build_executable():
-        # Create distribution package
-        create_distribution()
-        
-        print("\nBuild completed successfully!")
-        print("\nTo run the application:")
-        
-        system = platform.system()
-        if system == 'Darwin':
-            print("  - Double-click dist/SurvivalCurveExtractor.app")
-            print("  - Or run: open dist/SurvivalCurveExtractor.app")
-        elif system == 'Windows':
-            print("  - Double-click dist/SurvivalCurveExtractor.exe")
-        else:
-            print("  - Run: ./dist/SurvivalCurveExtractor")
-    else:
-        print("\nBuild failed!")
+    if args.watch:
+        watch_and_build(args, fresh)
+    elif not run_build(args, fresh):
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
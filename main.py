@@ -7,13 +7,27 @@ Uses tkinter for GUI and PIL for image handling.
 """
 
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter import ttk, messagebox
 import os
 import json
+import platform
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from PIL import Image, ImageTk, ImageDraw
+import PIL
+from PIL import Image, ImageTk
 from typing import Dict, List, Optional, Tuple
 
+# Resolved once: the platform decides button implementation and theme
+SYSTEM = platform.system()
+
+# File types offered when browsing a folder for images
+IMAGE_EXTENSIONS = frozenset({'.png', '.jpg', '.jpeg', '.gif', '.bmp'})
+
 
 class SurvivalCurveExtractor:
     def __init__(self):
@@ -26,16 +40,52 @@ class SurvivalCurveExtractor:
         self.original_image = None
         self.display_image = None
         self.canvas_image = None
+        self._canvas_image_key = None  # (path, mtime, width, height) currently shown on the canvas
+        self._canvas_photo_key = None  # (size, mode) canvas_image was created for
+        self._canvas_image_item = None
+        self._overlay_items = {}  # (kind, key) -> canvas item id for markers and lines
+        self._overlay_width = None
         self.scale_factor = 1.0
         
+        # Resized copies of recently shown images, keyed by (path, mtime, width, height)
+        self._display_cache = OrderedDict()
+        self._display_cache_size = 8
+        self._current_image_key = None
+        
+        # Cached sizes already re-rendered with LANCZOS once interaction paused
+        self._sharp_keys = set()
+        self._sharpen_pending = None
+        
+        # Background decoding of neighbouring images; both caches are shared with the pool
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=2)
+        self._prefetched = {}  # path -> (mtime, decoded PIL image)
+        self._cache_lock = threading.Lock()
+        
+        # Current image being decoded on the pool; finished paths come back through the queue
+        self._decoding_path = None
+        self._decoded_queue = queue.Queue()
+        self._decode_poll_scheduled = False
+        
         # Zoom view for calibration
         self.zoom_window = None
         self.zoom_canvas = None
+        self.zoom_photo = None
+        self._zoom_photo_mode = None
         self.zoom_factor = 3.0
         self.zoom_size = 100
         self.zoom_enabled = tk.BooleanVar(value=False)  # Default off
         
         
+        # Pending after() handles used to coalesce high-rate canvas events
+        self._motion_pending = None
+        self._motion_event = None
+        self._configure_pending = None
+        self._redraw_pending = None
+        self._overlay_redraw_pending = None
+        self._groups_scroll_pending = None
+        self._auto_save_pending = None
+        self._auto_save_target = None
+        
         # Dragging calibration points
         self.dragging_point = None
         self.drag_offset_x = 0
@@ -47,6 +97,8 @@ class SurvivalCurveExtractor:
             'x_min_coord': None, 'x_max_coord': None, 'y_min_coord': None, 'y_max_coord': None
         }
         self.calibration_step = 0
+        self._cal_transform_key = None
+        self._cal_transform = None
         self.calibration_labels = ['X-axis minimum', 'X-axis maximum', 'Y-axis minimum', 'Y-axis maximum']
         
         # Axis types and units
@@ -61,6 +113,7 @@ class SurvivalCurveExtractor:
         
         # Survival rate levels and groups
         self.survival_rates = ['0%', '25%', '50%', '75%', '100%']
+        self.survival_fractions = [float(rate.rstrip('%')) / 100.0 for rate in self.survival_rates]
         self.groups = []
         self.group_entries = []  # List to store group entry widgets
         
@@ -69,19 +122,25 @@ class SurvivalCurveExtractor:
         
         # Currently selected point for editing
         self.selected_point_key = None
+        self._tree_rows = {}  # point key (also the tree iid) -> row values shown in points_tree
         
         # Navigation system for dataset
         self.dataset_path = None
         self.image_files = []
         self.filtered_image_files = None  # For filtering incomplete images
         self.current_index = 0
-        self.metadata_cache = {}
+        self._status_cache = {}  # results path -> ((mtime_ns, size), status)
+        self._json_text_cache = OrderedDict()  # JSON file path -> ((mtime_ns, size), text), least recent first
+        self._json_text_cache_size = 256
         # Removed metadata_groups fallback - now only use current image's data
         self.auto_save_enabled = True
         self.ui_refreshing = False  # Flag to prevent auto-population during UI refresh
         self.loading_in_progress = False  # Flag to prevent auto-save during data loading
         self.user_modified_data = False  # Flag to track if user made changes since last load
         
+        # Buttons restyled on focus changes (filled by create_tk_button)
+        self._managed_buttons = set()
+        
         # Configure UI theme and colors
         self.configure_theme()
         
@@ -94,16 +153,15 @@ class SurvivalCurveExtractor:
         # Initially hide scrollbars and set sash position
         self.root.after(100, self.initial_layout_adjustments)
         
-        # Bind window focus events to maintain button styling on macOS
-        self.root.bind('<FocusIn>', lambda e: self.root.after(10, self.maintain_button_styling))
-        self.root.bind('<FocusOut>', lambda e: self.root.after(10, self.maintain_button_styling))
-        self.root.bind('<Activate>', lambda e: self.root.after(10, self.maintain_button_styling))
-        self.root.bind('<Deactivate>', lambda e: self.root.after(10, self.maintain_button_styling))
+        # Bind window focus events to maintain tk.Button styling (macOS uses Frame-based buttons)
+        if SYSTEM != 'Darwin':
+            self.root.bind('<FocusIn>', lambda e: self.root.after(10, self.maintain_button_styling))
+            self.root.bind('<FocusOut>', lambda e: self.root.after(10, self.maintain_button_styling))
+            self.root.bind('<Activate>', lambda e: self.root.after(10, self.maintain_button_styling))
+            self.root.bind('<Deactivate>', lambda e: self.root.after(10, self.maintain_button_styling))
     
     def configure_theme(self):
         """Configure consistent theme and colors across platforms"""
-        import platform
-        
         # Define color scheme
         self.colors = {
             'bg': '#2b2b2b',           # Dark gray background
@@ -124,12 +182,12 @@ class SurvivalCurveExtractor:
         style = ttk.Style()
         
         # Set theme based on platform
-        if platform.system() == 'Windows':
+        if SYSTEM == 'Windows':
             try:
                 style.theme_use('winnative')
             except:
                 style.theme_use('default')
-        elif platform.system() == 'Darwin':
+        elif SYSTEM == 'Darwin':
             try:
                 style.theme_use('aqua')
             except:
@@ -154,120 +212,121 @@ class SurvivalCurveExtractor:
         style.map('Treeview', background=[('selected', self.colors['select_bg'])],
                   foreground=[('selected', self.colors['select_fg'])])
     
-    def create_button(self, parent, text, command=None, width=None, state=None):
-        """Create a styled button with consistent dark theme"""
-        import platform
-        
-        if platform.system() == 'Darwin':  # macOS - use Frame-based button
-            # Create a frame that looks like a button for macOS
-            btn_frame = tk.Frame(parent, bg=self.colors['button_bg'], relief=tk.RAISED, bd=1)
-            
-            # Create label inside frame
-            btn_label = tk.Label(btn_frame, text=text, 
-                               bg=self.colors['button_bg'], fg=self.colors['text'],
-                               font=('Arial', 11, 'normal'),
-                               cursor='hand2')
-            btn_label.pack(expand=True, fill=tk.BOTH, padx=6, pady=4)
-            
-            # Store the command and other properties
-            btn_frame.command = command
-            btn_frame.btn_label = btn_label
-            btn_frame.is_enabled = True  # Track button state
-            
-            # Add click behavior
-            def on_click(event):
-                if btn_frame.winfo_exists() and getattr(btn_frame, 'is_enabled', True):
-                    # Visual feedback
-                    btn_frame.configure(relief=tk.SUNKEN)
-                    btn_label.config(bg='#4a4a4a')
-                    btn_frame.after(100, lambda: (
-                        btn_frame.configure(relief=tk.RAISED),
-                        btn_label.config(bg=self.colors['button_bg'])
-                    ) if btn_frame.winfo_exists() else None)
-                    # Execute command if provided
-                    if command:
-                        try:
-                            command()
-                        except Exception as e:
-                            print(f"Button command error: {e}")
-            
-            def on_enter(event):
-                if btn_frame.winfo_exists() and getattr(btn_frame, 'is_enabled', True):
-                    btn_label.config(bg='#4a4a4a')
-                    
-            def on_leave(event):
-                if btn_frame.winfo_exists() and getattr(btn_frame, 'is_enabled', True):
+    def create_macos_button(self, parent, text, command=None, width=None, state=None):
+        """Create a Frame-based button, since macOS ignores tk.Button colors"""
+        # Create a frame that looks like a button for macOS
+        btn_frame = tk.Frame(parent, bg=self.colors['button_bg'], relief=tk.RAISED, bd=1)
+        
+        # Create label inside frame
+        btn_label = tk.Label(btn_frame, text=text, 
+                           bg=self.colors['button_bg'], fg=self.colors['text'],
+                           font=('Arial', 11, 'normal'),
+                           cursor='hand2')
+        btn_label.pack(expand=True, fill=tk.BOTH, padx=6, pady=4)
+        
+        # Store the command and other properties
+        btn_frame.command = command
+        btn_frame.btn_label = btn_label
+        btn_frame.is_enabled = True  # Track button state
+        
+        # Add click behavior
+        def on_click(event):
+            if btn_frame.winfo_exists() and getattr(btn_frame, 'is_enabled', True):
+                # Visual feedback
+                btn_frame.configure(relief=tk.SUNKEN)
+                btn_label.config(bg='#4a4a4a')
+                btn_frame.after(100, lambda: (
+                    btn_frame.configure(relief=tk.RAISED),
                     btn_label.config(bg=self.colors['button_bg'])
-            
-            # Bind events to both frame and label for better reliability
-            for widget in [btn_frame, btn_label]:
-                widget.bind('<Button-1>', on_click)
-                widget.bind('<Enter>', on_enter)
-                widget.bind('<Leave>', on_leave)
-                widget.bind('<ButtonRelease-1>', lambda e: None)  # Consume event
-            
-            # Add simple config method to mimic tk.Button API
-            def config_method(**kwargs):
-                if 'state' in kwargs:
-                    if kwargs['state'] == tk.DISABLED:
-                        btn_frame.is_enabled = False
-                        btn_label.config(fg='#666666', cursor='')
-                        btn_frame.configure(bg='#2a2a2a')
-                        btn_label.config(bg='#2a2a2a')
-                    else:  # NORMAL or other enabled state
-                        btn_frame.is_enabled = True
-                        btn_label.config(fg=self.colors['text'], cursor='hand2')
-                        btn_frame.configure(bg=self.colors['button_bg'])
-                        btn_label.config(bg=self.colors['button_bg'])
-                if 'text' in kwargs:
-                    btn_label.config(text=kwargs['text'])
-                    
-            btn_frame.config = config_method
-            
-            if width:
-                btn_frame.configure(width=width * 8)  # Approximate character width
-            if state == tk.DISABLED:
-                btn_frame.config(state=tk.DISABLED)
-            else:
-                # Ensure button starts in enabled state
-                btn_frame.is_enabled = True
+                ) if btn_frame.winfo_exists() else None)
+                # Execute command if provided
+                if command:
+                    try:
+                        command()
+                    except Exception as e:
+                        print(f"Button command error: {e}")
+        
+        def on_enter(event):
+            if btn_frame.winfo_exists() and getattr(btn_frame, 'is_enabled', True):
+                btn_label.config(bg='#4a4a4a')
                 
-            return btn_frame
-            
-        else:  # Windows and Linux - use regular tk.Button
-            btn = tk.Button(parent, text=text, command=command,
-                           bg=self.colors['button_bg'], fg=self.colors['text'],
-                           activebackground='#4a4a4a', activeforeground='white',
-                           relief=tk.RAISED, bd=1,
-                           highlightthickness=0,
-                           font=('Arial', 11))
-            
-            if width:
-                btn.config(width=width)
-            if state:
-                btn.config(state=state)
+        def on_leave(event):
+            if btn_frame.winfo_exists() and getattr(btn_frame, 'is_enabled', True):
+                btn_label.config(bg=self.colors['button_bg'])
+        
+        # Bind events to both frame and label for better reliability
+        for widget in [btn_frame, btn_label]:
+            widget.bind('<Button-1>', on_click)
+            widget.bind('<Enter>', on_enter)
+            widget.bind('<Leave>', on_leave)
+            widget.bind('<ButtonRelease-1>', lambda e: None)  # Consume event
+        
+        # Add simple config method to mimic tk.Button API
+        def config_method(**kwargs):
+            if 'state' in kwargs:
+                if kwargs['state'] == tk.DISABLED:
+                    btn_frame.is_enabled = False
+                    btn_label.config(fg='#666666', cursor='')
+                    btn_frame.configure(bg='#2a2a2a')
+                    btn_label.config(bg='#2a2a2a')
+                else:  # NORMAL or other enabled state
+                    btn_frame.is_enabled = True
+                    btn_label.config(fg=self.colors['text'], cursor='hand2')
+                    btn_frame.configure(bg=self.colors['button_bg'])
+                    btn_label.config(bg=self.colors['button_bg'])
+            if 'text' in kwargs:
+                btn_label.config(text=kwargs['text'])
                 
-            return btn
+        btn_frame.config = config_method
+        
+        if width:
+            btn_frame.configure(width=width * 8)  # Approximate character width
+        if state == tk.DISABLED:
+            btn_frame.config(state=tk.DISABLED)
+        else:
+            # Ensure button starts in enabled state
+            btn_frame.is_enabled = True
+            
+        return btn_frame
+    
+    def create_tk_button(self, parent, text, command=None, width=None, state=None):
+        """Create a regular tk.Button with the dark theme (Windows and Linux)"""
+        btn = tk.Button(parent, text=text, command=command,
+                       bg=self.colors['button_bg'], fg=self.colors['text'],
+                       activebackground='#4a4a4a', activeforeground='white',
+                       relief=tk.RAISED, bd=1,
+                       highlightthickness=0,
+                       font=('Arial', 11))
+        
+        if width:
+            btn.config(width=width)
+        if state:
+            btn.config(state=state)
+        
+        # Track the button for maintain_button_styling until it is destroyed
+        self._managed_buttons.add(btn)
+        btn.bind('<Destroy>', lambda e: self._managed_buttons.discard(btn))
+            
+        return btn
     
+    # The platform cannot change at runtime, so pick the implementation once
+    create_button = create_macos_button if SYSTEM == 'Darwin' else create_tk_button
+        
     def maintain_button_styling(self):
         """Maintain button styling across all buttons (mainly for Windows/Linux)"""
-        import platform
-        if platform.system() != 'Darwin':  # Only needed for non-macOS
-            def apply_to_buttons(widget):
+        if SYSTEM != 'Darwin':  # Only needed for non-macOS
+            # create_tk_button registers every tk.Button, so no widget tree walk is needed
+            for btn in self._managed_buttons:
                 try:
-                    for child in widget.winfo_children():
-                        if isinstance(child, tk.Button):
-                            child.config(
-                                bg=self.colors['button_bg'], 
-                                fg=self.colors['text'],
-                                activebackground='#4a4a4a', 
-                                activeforeground='white',
-                                highlightbackground=self.colors['button_bg']
-                            )
-                        apply_to_buttons(child)
-                except:
+                    btn.config(
+                        bg=self.colors['button_bg'], 
+                        fg=self.colors['text'],
+                        activebackground='#4a4a4a', 
+                        activeforeground='white',
+                        highlightbackground=self.colors['button_bg']
+                    )
+                except tk.TclError:
                     pass
-            apply_to_buttons(self.root)
         
     def setup_ui(self):
         """Setup the user interface"""
@@ -684,6 +743,7 @@ class SurvivalCurveExtractor:
         
     def load_image(self):
         """Load a single image file"""
+        from tkinter import filedialog
         file_path = filedialog.askopenfilename(
             title="Select Image File",
             filetypes=[("Image files", "*.png *.jpg *.jpeg *.gif *.bmp")]
@@ -693,17 +753,25 @@ class SurvivalCurveExtractor:
             
     def browse_folder(self):
         """Browse folder and show image selection dialog"""
+        from tkinter import filedialog
         folder_path = filedialog.askdirectory(title="Select Folder with Images")
         if not folder_path:
             return
             
-        # Get all image files
-        image_extensions = {'.png', '.jpg', '.jpeg', '.gif', '.bmp'}
+        # Get all image files, walking the tree with os.scandir so non-images cost no Path objects
         image_files = []
-        
-        for file_path in Path(folder_path).rglob('*'):
-            if file_path.suffix.lower() in image_extensions:
-                image_files.append(str(file_path))
+        pending_dirs = [folder_path]
+        while pending_dirs:
+            try:
+                with os.scandir(pending_dirs.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending_dirs.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS and entry.is_file():
+                            image_files.append(entry.path)
+            except OSError as e:
+                print(f"Skipping unreadable folder: {e}")
+        image_files.sort()
                 
         if not image_files:
             messagebox.showinfo("No Images", "No image files found in the selected folder.")
@@ -733,9 +801,8 @@ class SurvivalCurveExtractor:
         listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Populate listbox
-        for file_path in image_files:
-            listbox.insert(tk.END, Path(file_path).name)
+        # Populate listbox in a single Tk call
+        listbox.insert(tk.END, *(os.path.basename(file_path) for file_path in image_files))
             
         def on_select():
             selection = listbox.curselection()
@@ -748,18 +815,27 @@ class SurvivalCurveExtractor:
         
     def load_image_file(self, file_path, preserve_state=False):
         """Load and display image file"""
+        self.flush_auto_save()
         try:
             self.current_image_path = file_path
-            self.original_image = Image.open(file_path)
+            
+            # Use the prefetched decode if the file has not changed since
+            mtime = os.stat(file_path).st_mtime_ns
+            with self._cache_lock:
+                prefetched = self._prefetched.pop(file_path, None)
+            self._current_image_key = (file_path, mtime)
+            if prefetched and prefetched[0] == mtime:
+                self.original_image = prefetched[1]
+                self._decoding_path = None
+            else:
+                # Image.open only reads the header; decode the pixels off the Tk thread
+                self.original_image = Image.open(file_path)
+                self.decode_in_background(file_path)
             
             # Only reset calibration and data if not preserving state
             if not preserve_state:
-                print(f"LOAD_IMAGE: Resetting calibration for {file_path}")
                 self.reset_calibration()
                 self.selected_points.clear()
-            else:
-                print(f"LOAD_IMAGE: Preserving calibration and points for {file_path}")
-                print(f"LOAD_IMAGE: Current calibration: {self.axis_calibration}")
             
             # Display image
             self.display_image_on_canvas()
@@ -789,30 +865,28 @@ class SurvivalCurveExtractor:
             
         img_width, img_height = self.original_image.size
         
-        # Calculate base scale to fit image in canvas
-        scale_x = (canvas_width - 50) / img_width
-        scale_y = (canvas_height - 50) / img_height
-        base_scale = min(scale_x, scale_y, 1.0)  # Don't scale up beyond original
-        
-        # Apply zoom level
-        if hasattr(self, 'zoom_level'):
-            self.scale_factor = base_scale * self.zoom_level
-        else:
-            self.scale_factor = base_scale
+        self.scale_factor = self.fit_scale(self.original_image.size, canvas_width, canvas_height,
+                                           getattr(self, 'zoom_level', 1.0))
         
         # Resize image
         new_width = int(img_width * self.scale_factor)
         new_height = int(img_height * self.scale_factor)
         
-        self.display_image = self.original_image.copy()
-        self.add_overlays_to_image()
-        
-        resized_image = self.display_image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        self.canvas_image = ImageTk.PhotoImage(resized_image)
+        # Only push new pixels to Tk when the image or its display size changed
+        image_key = self._current_image_key + (new_width, new_height)
+        if image_key != self._canvas_image_key:
+            with self._cache_lock:
+                image_ready = image_key in self._display_cache
+            if self._decoding_path == self.current_image_path and not image_ready:
+                # Still decoding in the background: hide the previous image rather than block
+                if self._canvas_image_item is not None:
+                    self.canvas.itemconfigure(self._canvas_image_item, state='hidden')
+            else:
+                self.update_canvas_image(image_key, new_width, new_height)
+        self.schedule_sharpen()
         
-        # Clear canvas and display image
-        self.canvas.delete("all")
-        self.canvas.create_image(25, 25, anchor=tk.NW, image=self.canvas_image)
+        # Calibration marks and points are canvas items, moved in place on every redraw
+        self.update_overlays(self.scale_factor)
         
         # Update canvas scroll region
         self.canvas.configure(scrollregion=(0, 0, new_width + 50, new_height + 50))
@@ -836,64 +910,277 @@ class SurvivalCurveExtractor:
             needs_h_scroll = (image_width + 50) > canvas_width
             needs_v_scroll = (image_height + 50) > canvas_height
             
-            print(f"Needs H scroll: {needs_h_scroll}, Needs V scroll: {needs_v_scroll}")
-            
             # Manage horizontal scrollbar using grid
             if needs_h_scroll:
-                print("Showing horizontal scrollbar")
                 self.h_scrollbar.grid(row=1, column=0, sticky="ew")
             else:
-                print("Hiding horizontal scrollbar")
                 self.h_scrollbar.grid_remove()
             
             # Manage vertical scrollbar using grid
             if needs_v_scroll:
-                print("Showing vertical scrollbar")
                 self.v_scrollbar.grid(row=0, column=1, sticky="ns")
             else:
-                print("Hiding vertical scrollbar")
                 self.v_scrollbar.grid_remove()
         
-    def add_overlays_to_image(self):
-        """Add calibration points, lines, and data points to image"""
-        if not self.display_image:
+    def redraw_overlays(self):
+        """Refresh only the markers when the image on the canvas is already the current one"""
+        if self._canvas_image_key is None or self._canvas_image_key[:2] != self._current_image_key:
+            self.display_image_on_canvas()
             return
+        self.update_overlays(self.scale_factor)
+    
+    def update_canvas_image(self, image_key, width, height):
+        """Show the resized image for image_key in the canvas image item"""
+        self.display_image = self.get_resized_image(width, height)
+        
+        # Reuse the Tk photo while the size and mode match; paste() avoids reallocating it
+        photo_key = (self.display_image.size, self.display_image.mode)
+        if self.canvas_image is not None and photo_key == self._canvas_photo_key:
+            self.canvas_image.paste(self.display_image)
+        else:
+            self.canvas_image = ImageTk.PhotoImage(self.display_image)
+            self._canvas_photo_key = photo_key
+            if self._canvas_image_item is None:
+                self._canvas_image_item = self.canvas.create_image(25, 25, anchor=tk.NW, image=self.canvas_image)
+                self.canvas.tag_lower(self._canvas_image_item)
+            else:
+                self.canvas.itemconfigure(self._canvas_image_item, image=self.canvas_image)
+        self.canvas.itemconfigure(self._canvas_image_item, state='normal')
+        self._canvas_image_key = image_key
+    
+    @staticmethod
+    def fit_scale(image_size, canvas_width, canvas_height, zoom_level=1.0):
+        """Scale factor that fits an image in the canvas at the given zoom level"""
+        img_width, img_height = image_size
+        scale_x = (canvas_width - 50) / img_width
+        scale_y = (canvas_height - 50) / img_height
+        base_scale = min(scale_x, scale_y, 1.0)  # Don't scale up beyond original
+        return base_scale * zoom_level
+    
+    def get_resized_image(self, width, height):
+        """Return the original image resized to width x height, cached per image and size"""
+        key = self._current_image_key + (width, height)
+        with self._cache_lock:
+            resized = self._display_cache.get(key)
+            if resized is not None:
+                self._display_cache.move_to_end(key)
+                return resized
+        
+        source = self.original_image
+        # A non-empty tile list means the pixels have not been decoded yet
+        if (source.format == 'JPEG' and getattr(source, 'tile', None)
+                and (width * 2 <= source.width or height * 2 <= source.height)):
+            # Let libjpeg scale by 1/2, 1/4 or 1/8 while decoding. A separate handle keeps
+            # original_image at full size, since all stored coordinates are in its pixels.
+            # Once original_image is decoded, resizing it is cheaper than decoding again
+            source = Image.open(self.current_image_path)
+            source.draft(source.mode, (width, height))
+        
+        # Fast BILINEAR preview; sharpen_canvas_image() swaps in LANCZOS once redraws settle.
+        # reducing_gap box-reduces by whole factors first, leaving the filter a much smaller input
+        resized = source.resize((width, height), Image.Resampling.BILINEAR, reducing_gap=3.0)
+        self.store_resized_image(key, resized)
+        return resized
+    
+    def store_resized_image(self, key, resized):
+        """Add a resized image to the display cache, evicting the least recently used"""
+        with self._cache_lock:
+            self._display_cache[key] = resized
+            self._display_cache.move_to_end(key)
+            self._sharp_keys.discard(key)
+            if len(self._display_cache) > self._display_cache_size:
+                evicted, _ = self._display_cache.popitem(last=False)
+                self._sharp_keys.discard(evicted)
+    
+    def schedule_sharpen(self):
+        """Re-render the shown image with LANCZOS once redraws have been quiet for a moment"""
+        if self._sharpen_pending is not None:
+            self.root.after_cancel(self._sharpen_pending)
+            self._sharpen_pending = None
+        if self._canvas_image_key is not None and self._canvas_image_key not in self._sharp_keys:
+            self._sharpen_pending = self.root.after(150, self.sharpen_canvas_image)
+    
+    def sharpen_canvas_image(self):
+        """Replace the BILINEAR preview on the canvas with a LANCZOS render of the same size"""
+        self._sharpen_pending = None
+        image_key = self._canvas_image_key
+        if (image_key is None or image_key[:2] != self._current_image_key
+                or self._decoding_path == self.current_image_path):
+            return
+        
+        width, height = image_key[2:]
+        sharp = self.original_image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+        self.store_resized_image(image_key, sharp)
+        self._sharp_keys.add(image_key)
+        self._canvas_image_key = None
+        self.update_canvas_image(image_key, width, height)
+    
+    def prefetch_neighbors(self, current_list):
+        """Decode and resize the images either side of the current one in the background"""
+        try:
+            canvas_width = self.canvas.winfo_width()
+            canvas_height = self.canvas.winfo_height()
+        except tk.TclError:
+            return
+        if canvas_width <= 1 or canvas_height <= 1:
+            return
+        
+        paths = [str(self.dataset_path / "png" / f"{current_list[i]}.png")
+                 for i in (self.current_index + 1, self.current_index - 1)
+                 if 0 <= i < len(current_list)]
+        
+        # Only keep decodes that are still one step away (or the current image's, if in flight)
+        with self._cache_lock:
+            for path in [p for p in self._prefetched if p not in paths and p != self.current_image_path]:
+                del self._prefetched[path]
+        
+        for path in paths:
+            self._prefetch_pool.submit(self.prefetch_image, path, canvas_width, canvas_height,
+                                       getattr(self, 'zoom_level', 1.0))
+    
+    def decode_in_background(self, path):
+        """Decode the current image on the pool; poll_decoded_images shows it when ready"""
+        try:
+            canvas_width = self.canvas.winfo_width()
+            canvas_height = self.canvas.winfo_height()
+        except tk.TclError:
+            return
+        if canvas_width <= 1 or canvas_height <= 1:
+            self._decoding_path = None  # Canvas not laid out yet; the display path decodes directly
+            return
+        
+        self._decoding_path = path
+        future = self._prefetch_pool.submit(self.prefetch_image, path, canvas_width, canvas_height,
+                                            getattr(self, 'zoom_level', 1.0),
+                                            lambda: self._decoded_queue.put((path, False)))
+        future.add_done_callback(lambda f: self._decoded_queue.put((path, True)))
+        if not self._decode_poll_scheduled:
+            self._decode_poll_scheduled = True
+            self.root.after(20, self.poll_decoded_images)
+    
+    def poll_decoded_images(self):
+        """Display the current image once its background decode finishes (runs on the Tk thread)"""
+        while True:
+            try:
+                path, finished = self._decoded_queue.get_nowait()
+            except queue.Empty:
+                break
+            # Ignore decodes for images the user has already navigated away from
+            if path != self._decoding_path or path != self.current_image_path:
+                continue
+            
+            if not finished:
+                # A reduced-scale display copy is cached; show it while the full decode runs
+                try:
+                    self.display_image_on_canvas()
+                except Exception as e:
+                    print(f"PREFETCH: Failed to show preview of {path}: {e}")
+                continue
             
-        draw = ImageDraw.Draw(self.display_image)
+            self._decoding_path = None
+            with self._cache_lock:
+                decoded = self._prefetched.pop(path, None)
+            if decoded and decoded[0] == self._current_image_key[1]:
+                self.original_image = decoded[1]
+            try:
+                self.display_image_on_canvas()
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load image: {str(e)}")
         
-        # Draw calibration points
+        if self._decoding_path is not None:
+            self.root.after(20, self.poll_decoded_images)
+        else:
+            self._decode_poll_scheduled = False
+    
+    def prefetch_image(self, path, canvas_width, canvas_height, zoom_level, on_preview=None):
+        """Decode one image and cache its display-size copy (runs on the prefetch pool)"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            with self._cache_lock:
+                cached = self._prefetched.get(path)
+            if cached and cached[0] == mtime:
+                return
+            
+            image = Image.open(path)
+            scale = self.fit_scale(image.size, canvas_width, canvas_height, zoom_level)
+            size = (int(image.width * scale), int(image.height * scale))
+            key = (path, mtime) + size
+            drafted = image.format == 'JPEG' and scale <= 0.5
+            if drafted:
+                # Let libjpeg decode at 1/2, 1/4 or 1/8 scale for the display copy and publish
+                # it before the full decode. original_image stays at full size, since all
+                # stored coordinates are in its pixels
+                with Image.open(path) as preview:
+                    preview.draft(preview.mode, size)
+                    resized = preview.resize(size, Image.Resampling.BILINEAR, reducing_gap=3.0)
+                self.store_resized_image(key, resized)
+                if on_preview:
+                    on_preview()
+            
+            image.load()  # Force the decode here rather than on the Tk thread
+            if not drafted:
+                resized = image.resize(size, Image.Resampling.BILINEAR, reducing_gap=3.0)
+            
+            with self._cache_lock:
+                self._prefetched[path] = (mtime, image)
+            if not drafted:
+                self.store_resized_image(key, resized)
+        except Exception as e:
+            print(f"PREFETCH: Failed to prefetch {path}: {e}")
+        
+    def update_overlays(self, scale=1.0):
+        """Create, move, or remove canvas items for calibration points, lines, and data points"""
+        # Image pixels map to canvas coordinates via the display scale and the 25px image offset
+        width = max(1, round(2 * scale))
+        shapes = {}  # (kind, key) -> (create method, coords, options)
+        
+        # Calibration points as cross markers
         for key, coord in self.axis_calibration.items():
             if coord and key.endswith('_coord'):
-                x, y = coord
-                # Draw cross marker
-                size = 5
-                draw.line([(x-size, y), (x+size, y)], fill='red', width=2)
-                draw.line([(x, y-size), (x, y+size)], fill='red', width=2)
+                x, y = coord[0] * scale + 25, coord[1] * scale + 25
+                size = 5 * scale
+                shapes[('cal_h', key)] = (self.canvas.create_line, (x-size, y, x+size, y), {'fill': 'red', 'width': width})
+                shapes[('cal_v', key)] = (self.canvas.create_line, (x, y-size, x, y+size), {'fill': 'red', 'width': width})
                 
-        # Draw survival rate lines if calibration is complete
+        # Survival rate lines if calibration is complete
         if self.is_calibration_complete():
-            self.draw_survival_rate_lines(draw)
+            self.draw_survival_rate_lines(shapes, scale)
             
-        # Draw selected data points (only those with coordinates)
+        # Selected data points (only those with coordinates)
         for key, point in self.selected_points.items():
             if point['x'] is not None and point['y'] is not None:
-                x, y = point['x'], point['y']
-                size = 4
-                draw.ellipse([(x-size, y-size), (x+size, y+size)], fill='blue', outline='darkblue', width=2)
-            
-    def draw_survival_rate_lines(self, draw):
-        """Draw horizontal lines for different survival rate levels"""
-        x_min_coord = self.axis_calibration['x_min_coord'][0]
-        x_max_coord = self.axis_calibration['x_max_coord'][0]
-        y_min_coord = self.axis_calibration['y_min_coord'][1]
-        y_max_coord = self.axis_calibration['y_max_coord'][1]
+                x, y = point['x'] * scale + 25, point['y'] * scale + 25
+                size = 4 * scale
+                shapes[('point', key)] = (self.canvas.create_oval, (x-size, y-size, x+size, y+size),
+                                          {'fill': 'blue', 'outline': 'darkblue', 'width': width})
+        
+        # Delete items whose point is gone, then move existing items or create new ones
+        for item_key in [k for k in self._overlay_items if k not in shapes]:
+            self.canvas.delete(self._overlay_items.pop(item_key))
+        for item_key, (create, coords, options) in shapes.items():
+            item = self._overlay_items.get(item_key)
+            if item is None:
+                self._overlay_items[item_key] = create(*coords, **options)
+            else:
+                self.canvas.coords(item, *coords)
+                if width != self._overlay_width:
+                    self.canvas.itemconfigure(item, width=options['width'])
+        self._overlay_width = width
+            
+    def draw_survival_rate_lines(self, shapes, scale=1.0):
+        """Add horizontal lines for different survival rate levels to the overlay shapes"""
+        x_min_coord = self.axis_calibration['x_min_coord'][0] * scale + 25
+        x_max_coord = self.axis_calibration['x_max_coord'][0] * scale + 25
+        y_min_coord = self.axis_calibration['y_min_coord'][1] * scale + 25
+        y_max_coord = self.axis_calibration['y_max_coord'][1] * scale + 25
         
         # Draw horizontal lines for survival rate levels: 0%, 25%, 50%, 75%, 100%
         # Y-axis represents survival rate, so we split it into these levels
-        for i, survival_rate in enumerate(self.survival_rates):
-            percentage = float(survival_rate.replace('%', '')) / 100.0
-            y_coord = y_min_coord + percentage * (y_max_coord - y_min_coord)
-            draw.line([(x_min_coord, y_coord), (x_max_coord, y_coord)], fill='red', width=1)
+        y_span = y_max_coord - y_min_coord
+        for survival_rate, fraction in zip(self.survival_rates, self.survival_fractions):
+            y_coord = y_min_coord + fraction * y_span
+            shapes[('rate', survival_rate)] = (self.canvas.create_line, (x_min_coord, y_coord, x_max_coord, y_coord),
+                                               {'fill': 'red', 'width': 1})
             
     def on_canvas_click(self, event):
         """Handle canvas click events"""
@@ -916,12 +1203,12 @@ class SurvivalCurveExtractor:
         near_calibration_point = False
         for key, coord in self.axis_calibration.items():
             if coord and key.endswith('_coord'):
-                x, y = coord
-                distance = ((img_x - x) ** 2 + (img_y - y) ** 2) ** 0.5
-                if distance < 15:  # Within 15 pixels
+                dx = img_x - coord[0]
+                dy = img_y - coord[1]
+                if dx * dx + dy * dy < 225:  # Within 15 pixels
                     self.dragging_point = key
-                    self.drag_offset_x = img_x - x
-                    self.drag_offset_y = img_y - y
+                    self.drag_offset_x = dx
+                    self.drag_offset_y = dy
                     near_calibration_point = True
                     break
         
@@ -945,7 +1232,7 @@ class SurvivalCurveExtractor:
             
         # Show clicked point
         self.last_click = (x, y)
-        self.display_image_on_canvas()
+        self.redraw_overlays()
         
         # Enable calibration button
         self.calibration_btn.config(state=tk.NORMAL)
@@ -1010,7 +1297,7 @@ class SurvivalCurveExtractor:
             self.calibration_btn.config(state=tk.DISABLED)
             
         # Refresh display
-        self.display_image_on_canvas()
+        self.redraw_overlays()
         
         # Auto-save after calibration changes
         self.auto_save_current_state()
@@ -1028,7 +1315,7 @@ class SurvivalCurveExtractor:
             delattr(self, 'last_click')
             
         if self.original_image:
-            self.display_image_on_canvas()
+            self.redraw_overlays()
             
     def is_calibration_complete(self):
         """Check if calibration is complete"""
@@ -1078,26 +1365,44 @@ class SurvivalCurveExtractor:
         self.update_points_tree()
         
         # Refresh display
-        self.display_image_on_canvas()
+        self.redraw_overlays()
         
-        # Auto-save after data point changes
-        self.auto_save_current_state()
+        # Auto-save after data point changes, once a burst of clicks has ended
+        self.schedule_auto_save()
+        
+    def get_calibration_transform(self):
+        """Return (sx, tx, sy, ty) mapping pixels to axis values, or None if not calibrated"""
+        # Recompute only when a calibration value changes; the key is compared, not hashed
+        key = tuple(self.axis_calibration.values())
+        if key == self._cal_transform_key:
+            return self._cal_transform
         
-    def get_real_coordinates(self, pixel_x, pixel_y):
+        transform = None
+        if self.is_calibration_complete():
+            x_min_val, x_max_val = self.axis_calibration['x_min'], self.axis_calibration['x_max']
+            y_min_val, y_max_val = self.axis_calibration['y_min'], self.axis_calibration['y_max']
+            x_min_coord, x_max_coord = self.axis_calibration['x_min_coord'][0], self.axis_calibration['x_max_coord'][0]
+            y_min_coord, y_max_coord = self.axis_calibration['y_min_coord'][1], self.axis_calibration['y_max_coord'][1]
+            
+            if x_max_coord != x_min_coord and y_max_coord != y_min_coord:
+                # real_x = sx * pixel_x + tx; real_y = sy * pixel_y + ty (Y pixels grow downwards)
+                sx = (x_max_val - x_min_val) / (x_max_coord - x_min_coord)
+                sy = -(y_max_val - y_min_val) / (y_max_coord - y_min_coord)
+                transform = (sx, x_min_val - x_min_coord * sx, sy, y_min_val - y_max_coord * sy)
+        
+        self._cal_transform_key = key
+        self._cal_transform = transform
+        return transform
+        
+    def get_real_coordinates(self, pixel_x, pixel_y, transform=None):
         """Convert pixel coordinates to real axis values"""
-        if not self.is_calibration_complete():
+        if transform is None:
+            transform = self.get_calibration_transform()
+        if transform is None:
             return None, None
-            
-        x_min_val, x_max_val = self.axis_calibration['x_min'], self.axis_calibration['x_max']
-        y_min_val, y_max_val = self.axis_calibration['y_min'], self.axis_calibration['y_max']
-        x_min_coord, x_max_coord = self.axis_calibration['x_min_coord'][0], self.axis_calibration['x_max_coord'][0]
-        y_min_coord, y_max_coord = self.axis_calibration['y_min_coord'][1], self.axis_calibration['y_max_coord'][1]
-        
-        # Calculate real coordinates
-        real_x = x_min_val + (pixel_x - x_min_coord) * (x_max_val - x_min_val) / (x_max_coord - x_min_coord)
-        real_y = y_min_val + (y_max_coord - pixel_y) * (y_max_val - y_min_val) / (y_max_coord - y_min_coord)
         
-        return real_x, real_y
+        sx, tx, sy, ty = transform
+        return sx * pixel_x + tx, sy * pixel_y + ty
         
     def export_data(self):
         """Export data to JSON file"""
@@ -1114,6 +1419,7 @@ class SurvivalCurveExtractor:
         self.y_axis_units = self.y_units_entry.get().strip() or self.y_axis_units
         
         # Prepare data structure - time values for each survival rate level
+        transform = self.get_calibration_transform()
         data_dict = {}
         for survival_rate in self.survival_rates:
             data_dict[survival_rate] = {}
@@ -1123,7 +1429,7 @@ class SurvivalCurveExtractor:
                     point = self.selected_points[key]
                     # Only convert coordinates if the point has been set
                     if point['x'] is not None and point['y'] is not None:
-                        real_x, real_y = self.get_real_coordinates(point['x'], point['y'])
+                        real_x, real_y = self.get_real_coordinates(point['x'], point['y'], transform)
                         data_dict[survival_rate][group] = real_x if real_x is not None else None
                     else:
                         # Point exists but hasn't been set yet
@@ -1132,21 +1438,21 @@ class SurvivalCurveExtractor:
                     data_dict[survival_rate][group] = None
         
         # Include units and metadata in export structure
+        image_path = Path(self.current_image_path)
         result = {
             'metadata': {
                 'x_axis_type': self.x_axis_type,
                 'y_axis_type': self.y_axis_type,
                 'x_axis_units': self.x_axis_units,
                 'y_axis_units': self.y_axis_units,
-                'image_file': Path(self.current_image_path).name
+                'image_file': image_path.name
             },
             'data': data_dict
         }
                     
         # Generate filename
-        image_name = Path(self.current_image_path).stem
-        output_filename = f"{image_name}_extracted_survival_time_points.json"
-        output_path = Path(self.current_image_path).parent / output_filename
+        output_filename = f"{image_path.stem}_extracted_survival_time_points.json"
+        output_path = image_path.parent / output_filename
         
         # Save JSON
         try:
@@ -1216,12 +1522,8 @@ class SurvivalCurveExtractor:
         base_name = Path(self.current_image_path).stem
         status = None
         try:
-            results_path = self.dataset_path / "results" / f"{base_name}.json"
-            if results_path.exists():
-                with open(results_path, 'r', encoding='utf-8-sig') as f:
-                    data = json.load(f)
-                status = data.get("status")
-                print(f"TOGGLE: Current status for {base_name} is '{status}'")
+            status = self.read_result_status(base_name)
+            print(f"TOGGLE: Current status for {base_name} is '{status}'")
         except Exception as e:
             print(f"TOGGLE: Error getting status for {base_name}: {e}")
         
@@ -1274,15 +1576,8 @@ class SurvivalCurveExtractor:
         try:
             # Get the base name from current path
             base_name = Path(self.current_image_path).stem
-            results_path = self.dataset_path / "results" / f"{base_name}.json"
-            
-            if results_path.exists():
-                with open(results_path, 'r', encoding='utf-8-sig') as f:
-                    data = json.load(f)
-                    status = data.get("status")
-                    print(f"REFRESH_UI: Read status '{status}' for {base_name}")
-            else:
-                print(f"REFRESH_UI: No results file for {base_name}")
+            status = self.read_result_status(base_name)
+            print(f"REFRESH_UI: Read status '{status}' for {base_name}")
         except Exception as e:
             print(f"REFRESH_UI: could not read status for {self.current_image_path}: {e}")
 
@@ -1309,6 +1604,7 @@ class SurvivalCurveExtractor:
             return
             
         # Show dialog to input error text
+        from tkinter import simpledialog
         error_text = simpledialog.askstring(
             "Report Error",
             "Describe the error or issue with this image:",
@@ -1355,20 +1651,35 @@ class SurvivalCurveExtractor:
     def get_image_status_indicator(self, base_name):
         """Get status indicator (✓/✗/◯) for an image"""
         try:
-            results_path = self.dataset_path / "results" / f"{base_name}.json"
-            if results_path.exists():
-                with open(results_path, 'r', encoding='utf-8-sig') as f:
-                    data = json.load(f)
-                
-                if "status" in data:
-                    if data["status"] == "done":
-                        return "✓"
-                    elif data["status"] == "error":
-                        return "✗"
+            status = self.read_result_status(base_name)
+            if status == "done":
+                return "✓"
+            elif status == "error":
+                return "✗"
             return "◯"  # Not completed
         except:
             return "◯"
     
+    def read_result_status(self, base_name, stat_result=None):
+        """Read the status field of an image's results file, memoized on the file's mtime and size"""
+        results_path = self.dataset_path / "results" / f"{base_name}.json"
+        if stat_result is None:
+            try:
+                stat_result = results_path.stat()
+            except FileNotFoundError:
+                return None
+        
+        stamp = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._status_cache.get(results_path)
+        if cached and cached[0] == stamp:
+            return cached[1]
+        
+        with open(results_path, 'r', encoding='utf-8-sig') as f:
+            data = json.load(f)
+        status = data.get("status") if isinstance(data, dict) else None
+        self._status_cache[results_path] = (stamp, status)
+        return status
+    
     def get_completion_stats(self):
         """Get completion statistics for the dataset"""
         if not self.dataset_path:
@@ -1384,57 +1695,64 @@ class SurvivalCurveExtractor:
             return 0, 0, 0
         
         # Count total metadata files
-        metadata_files = list(metadata_path.glob("*.json"))
+        metadata_files = self.scan_json_files(metadata_path)
         total_count = len(metadata_files)
         
         if total_count == 0:
             return 0, 0, 0
         
-        done_count = 0
-        error_count = 0
-        
         # Check results folder for completion status
-        results_path = self.dataset_path / "results"
-        if results_path.exists():
-            for metadata_file in metadata_files:
-                base_name = metadata_file.stem
-                result_file = results_path / f"{base_name}.json"
-                
-                if result_file.exists():
-                    try:
-                        with open(result_file, 'r', encoding='utf-8-sig') as f:
-                            data = json.load(f)
-                        
-                        if "status" in data:
-                            if data["status"] == "done":
-                                done_count += 1
-                            elif data["status"] == "error":
-                                error_count += 1
-                    except Exception as e:
-                        print(f"Error reading status from {result_file}: {e}")
-                        continue
+        statuses = self.scan_result_statuses()
+        done_count = sum(1 for base_name in metadata_files if statuses.get(base_name) == "done")
+        error_count = sum(1 for base_name in metadata_files if statuses.get(base_name) == "error")
                 
         return done_count, error_count, total_count
     
+    def scan_result_statuses(self):
+        """Map every image with a results file to its status in one directory pass"""
+        results_path = self.dataset_path / "results"
+        statuses = {}
+        stale = []
+        for base_name, stat_result in self.scan_json_files(results_path).items():
+            # Reuse the directory scan's stat so unchanged files cost no I/O
+            cached = self._status_cache.get(results_path / f"{base_name}.json")
+            if cached and cached[0] == (stat_result.st_mtime_ns, stat_result.st_size):
+                statuses[base_name] = cached[1]
+            else:
+                stale.append((base_name, stat_result))
+        
+        # New or changed files (first load, bulk edits) are read in parallel, since file reads release the GIL
+        if stale:
+            with ThreadPoolExecutor(max_workers=min(16, len(stale))) as pool:
+                futures = {base_name: pool.submit(self.read_result_status, base_name, stat_result)
+                           for base_name, stat_result in stale}
+            for base_name, future in futures.items():
+                try:
+                    statuses[base_name] = future.result()
+                except Exception as e:
+                    print(f"Error reading status for {base_name}: {e}")
+        return statuses
+    
     def refresh_groups_ui(self):
         """Refresh groups UI to match current groups list without triggering auto-population"""
         # Set flag to prevent auto-population during UI refresh
         self.ui_refreshing = True
         
-        # Clear existing group entries
-        for group_data in self.group_entries:
+        # Reuse existing group fields; only surplus ones are destroyed and missing ones created
+        for group_data in self.group_entries[len(self.groups):]:
             group_data['frame'].destroy()
-        self.group_entries.clear()
+        del self.group_entries[len(self.groups):]
         
-        # Add group fields for current groups (without triggering events)
+        # Fill a field per current group (without triggering events)
         for i, group_name in enumerate(self.groups):
-            self.add_group_field_silent()
-            if self.group_entries:
-                last_entry = self.group_entries[-1]['entry']
-                last_entry.delete(0, tk.END)
-                last_entry.insert(0, group_name)
-                # Bind the event AFTER setting the value to avoid triggering during restore
-                last_entry.bind('<KeyRelease>', lambda e: self.update_groups())
+            if i == len(self.group_entries):
+                self.add_group_field_silent()
+            entry = self.group_entries[i]['entry']
+            if entry.get() != group_name:
+                entry.delete(0, tk.END)
+                entry.insert(0, group_name)
+            # Bind the event AFTER setting the value to avoid triggering during restore
+            entry.bind('<KeyRelease>', lambda e: self.update_groups())
         
         # Add one empty field if no groups exist
         if not self.groups:
@@ -1466,14 +1784,15 @@ class SurvivalCurveExtractor:
         """Apply or remove incomplete images filter"""
         if not self.dataset_path or not self.image_files:
             return
+        
+        # Pending edits belong to the image shown before the filter changes the index
+        self.flush_auto_save()
             
         if self.only_incomplete_var.get():
-            # Filter to show only incomplete images
-            self.filtered_image_files = []
-            for image_file in self.image_files:
-                status_indicator = self.get_image_status_indicator(image_file)
-                if status_indicator == "◯":  # Not completed
-                    self.filtered_image_files.append(image_file)
+            # Filter to show only incomplete images: everything not in the completed set
+            completed = {base_name for base_name, status in self.scan_result_statuses().items()
+                         if status in ("done", "error")}
+            self.filtered_image_files = [f for f in self.image_files if f not in completed]
             
             # Reset current index to first incomplete image
             if self.filtered_image_files:
@@ -1526,10 +1845,9 @@ class SurvivalCurveExtractor:
             self.user_modified_data = True
             print(f"SUBPLOT_CHANGE: User modified subplot label to '{self.subplot_label}'")
             
-            # Force immediate save
+            # Save once typing pauses
             if not self.loading_in_progress:
-                print("SUBPLOT_CHANGE: Forcing immediate save")
-                self.auto_save_current_state()
+                self.schedule_auto_save()
                 
     def on_notes_change(self, event=None):
         """Handle notes change"""
@@ -1547,10 +1865,9 @@ class SurvivalCurveExtractor:
             self.user_modified_data = True
             print(f"NOTES_CHANGE: User modified notes (length: {len(self.curator_notes)})")
             
-            # Force immediate save
+            # Save once typing pauses
             if not self.loading_in_progress:
-                print("NOTES_CHANGE: Forcing immediate save")
-                self.auto_save_current_state()
+                self.schedule_auto_save()
     
     def on_units_change(self, event=None):
         """Handle axis units change"""
@@ -1574,10 +1891,9 @@ class SurvivalCurveExtractor:
         self.user_modified_data = True
         print(f"UNITS_CHANGE: User modified units to x={self.x_axis_units}, y={self.y_axis_units}")
         
-        # Force immediate save of units changes
+        # Save units changes once typing pauses
         if not self.loading_in_progress:
-            print("UNITS_CHANGE: Forcing immediate save")
-            self.auto_save_current_state()
+            self.schedule_auto_save()
         
     def show_zoom_window(self, center_x, center_y):
         """Show zoom window for precise calibration"""
@@ -1599,6 +1915,7 @@ class SurvivalCurveExtractor:
             
             self.zoom_canvas = tk.Canvas(self.zoom_window, width=self.zoom_size*2, height=self.zoom_size*2, bg=self.colors['bg'])
             self.zoom_canvas.pack()
+            self.zoom_photo = None  # New canvas needs a new image item
             
         # Create zoomed image
         img_width, img_height = self.original_image.size
@@ -1610,11 +1927,12 @@ class SurvivalCurveExtractor:
         right = min(img_width, int(center_x + crop_size // 2))
         bottom = min(img_height, int(center_y + crop_size // 2))
         
-        # Crop and zoom
-        cropped = self.original_image.crop((left, top, right, bottom))
-        zoomed = cropped.resize((self.zoom_size*2, self.zoom_size*2), Image.Resampling.NEAREST)
+        # Crop and zoom in one pass; resize's box argument avoids an intermediate crop copy
+        zoomed = self.original_image.resize((self.zoom_size*2, self.zoom_size*2), Image.Resampling.NEAREST,
+                                            box=(left, top, right, bottom))
         
-        # Draw enhanced guidelines
+        # Draw enhanced guidelines (ImageDraw is only needed once the zoom view opens)
+        from PIL import ImageDraw
         draw = ImageDraw.Draw(zoomed)
         center = self.zoom_size
         zoom_width = self.zoom_size * 2
@@ -1631,34 +1949,47 @@ class SurvivalCurveExtractor:
             y_max_coord = self.axis_calibration['y_max_coord'][1] if self.axis_calibration['y_max_coord'] else None
             
             if y_min_coord is not None and y_max_coord is not None:
-                # Calculate survival line positions
-                survival_percentages = [0, 25, 50, 75, 100]
+                # Calculate survival line positions from the precomputed rate fractions
+                y_span = y_min_coord - y_max_coord
+                crop_height = bottom - top
                 
-                for percentage in survival_percentages:
+                for survival_rate, fraction in zip(self.survival_rates, self.survival_fractions):
                     # Calculate Y position for this survival percentage
-                    ratio = percentage / 100.0
-                    survival_y = y_min_coord - (ratio * (y_min_coord - y_max_coord))
+                    survival_y = y_min_coord - fraction * y_span
                     
                     # Check if this line is visible in the zoom view
                     relative_y = survival_y - top
-                    if 0 <= relative_y <= (bottom - top):
+                    if 0 <= relative_y <= crop_height:
                         # Scale to zoom view
-                        zoom_y = int(relative_y * zoom_height / (bottom - top))
+                        zoom_y = int(relative_y * zoom_height / crop_height)
                         
                         # Draw the survival guideline
                         color = 'red'
                         draw.line([(0, zoom_y), (zoom_width, zoom_y)], fill=color, width=2)
                         
                         # Add percentage label
-                        draw.text((5, zoom_y + 2), f"{percentage}%", fill=color)
+                        draw.text((5, zoom_y + 2), survival_rate, fill=color)
         
-        # Display zoomed image
-        self.zoom_photo = ImageTk.PhotoImage(zoomed)
-        self.zoom_canvas.delete("all")
-        self.zoom_canvas.create_image(0, 0, anchor=tk.NW, image=self.zoom_photo)
+        # Display zoomed image, pasting into the existing photo when possible (size is fixed)
+        if self.zoom_photo is not None and self._zoom_photo_mode == zoomed.mode:
+            self.zoom_photo.paste(zoomed)
+        else:
+            self.zoom_photo = ImageTk.PhotoImage(zoomed)
+            self._zoom_photo_mode = zoomed.mode
+            self.zoom_canvas.delete("all")
+            self.zoom_canvas.create_image(0, 0, anchor=tk.NW, image=self.zoom_photo)
         
     def on_canvas_motion(self, event):
-        """Handle mouse motion for pan mode"""
+        """Coalesce mouse motion so the zoom window updates at most once per frame"""
+        self._motion_event = event
+        if self._motion_pending is None:
+            self._motion_pending = self.root.after(16, self.flush_canvas_motion)
+    
+    def flush_canvas_motion(self):
+        """Handle the latest mouse motion for pan mode"""
+        self._motion_pending = None
+        event = self._motion_event
+        
         # Legacy zoom functionality (if enabled)
         if not self.canvas_image or not self.zoom_enabled.get():
             return
@@ -1697,10 +2028,19 @@ class SurvivalCurveExtractor:
         new_x = max(0, min(new_x, self.original_image.width))
         new_y = max(0, min(new_y, self.original_image.height))
         
+        # Motion events at the same canvas pixel (or clamped at the edge) move nothing
+        if self.axis_calibration[self.dragging_point] == (new_x, new_y):
+            return
         self.axis_calibration[self.dragging_point] = (new_x, new_y)
         
-        # Refresh display
-        self.display_image_on_canvas()
+        # Refresh display once the queued drag events have been applied
+        if self._overlay_redraw_pending is None:
+            self._overlay_redraw_pending = self.root.after_idle(self.flush_overlay_redraw)
+    
+    def flush_overlay_redraw(self):
+        """Redraw the markers for the latest dragged calibration position"""
+        self._overlay_redraw_pending = None
+        self.redraw_overlays()
         
     def on_zoom_toggle(self):
         """Handle zoom enable/disable toggle"""
@@ -1716,19 +2056,21 @@ class SurvivalCurveExtractor:
         if not hasattr(self, 'points_tree'):
             return
         
-        # Clear existing items
-        for item in self.points_tree.get_children():
-            self.points_tree.delete(item)
+        # Rows are updated in place, so clear the selection as the old full rebuild did
+        selection = self.points_tree.selection()
+        if selection:
+            self.points_tree.selection_remove(selection)
         
         # Create a sorted list of points with proper ordering
         # Group by survival rate, then show base point followed by any extra points
         points_by_rate = {}
+        current_groups = set(self.groups)
         
         for key, point in self.selected_points.items():
             group, survival_rate = self.parse_point_key(key)
             
             # Check if group is in current groups
-            if group not in self.groups:
+            if group not in current_groups:
                 continue
             
             # Determine base survival rate (remove _extra suffix if present)
@@ -1737,10 +2079,12 @@ class SurvivalCurveExtractor:
             if base_rate not in points_by_rate:
                 points_by_rate[base_rate] = []
             
-            points_by_rate[base_rate].append((group, survival_rate, point))
+            points_by_rate[base_rate].append((group, survival_rate, key, point))
         
         # Sort by survival rate order (0%, 25%, 50%, 75%, 100%)
         survival_order = ['0%', '25%', '50%', '75%', '100%']
+        transform = self.get_calibration_transform()
+        rows = []  # (point key, row values) in display order
         
         for base_rate in survival_order:
             if base_rate in points_by_rate:
@@ -1748,19 +2092,34 @@ class SurvivalCurveExtractor:
                 sorted_points = sorted(points_by_rate[base_rate], 
                                      key=lambda x: (x[0], '_extra' in x[1]))
                 
-                for group, survival_rate, point in sorted_points:
+                for group, survival_rate, key, point in sorted_points:
                     # Handle both set points and placeholder points
                     if point['x'] is not None and point['y'] is not None:
-                        real_x, real_y = self.get_real_coordinates(point['x'], point['y'])
+                        real_x, real_y = self.get_real_coordinates(point['x'], point['y'], transform)
                         time_value = f"{real_x:.2f}" if real_x is not None else "N/A"
                     else:
                         time_value = "N/A"
                     
-                    self.points_tree.insert('', 'end', values=(
-                        group,
-                        survival_rate,
-                        time_value
-                    ))
+                    rows.append((key, (group, survival_rate, time_value)))
+        
+        # Each row's iid is its point key: drop rows for removed points, then insert or
+        # update only the rows whose values changed
+        wanted = dict(rows)
+        for key in [k for k in self._tree_rows if k not in wanted]:
+            self.points_tree.delete(key)
+            del self._tree_rows[key]
+        for index, (key, values) in enumerate(rows):
+            if key not in self._tree_rows:
+                self.points_tree.insert('', index, iid=key, values=values)
+            elif self._tree_rows[key] != values:
+                self.points_tree.item(key, values=values)
+            self._tree_rows[key] = values
+        
+        # Reorder only if the order actually changed
+        order = [key for key, _ in rows]
+        if list(self.points_tree.get_children()) != order:
+            for index, key in enumerate(order):
+                self.points_tree.move(key, '', index)
             
     
     def on_treeview_edit(self, event):
@@ -1778,6 +2137,7 @@ class SurvivalCurveExtractor:
         key = f"{group}_{survival_rate}"
         
         # Show input dialog for new time value
+        from tkinter import simpledialog
         new_time = simpledialog.askfloat(
             "Edit Time Value",
             f"Edit time value for {group} - {survival_rate}:",
@@ -1787,19 +2147,12 @@ class SurvivalCurveExtractor:
         
         if new_time is not None:
             # Update the point's coordinates based on new time value
-            if key in self.selected_points and self.is_calibration_complete():
-                # Get calibration coordinates (they are tuples)
-                x_min_coord = self.axis_calibration['x_min_coord'][0]  # x coordinate of min point
-                x_max_coord = self.axis_calibration['x_max_coord'][0]  # x coordinate of max point
-                x_min_val = self.axis_calibration['x_min']
-                x_max_val = self.axis_calibration['x_max']
-                
-                # Calculate new pixel x position
-                x_range = x_max_val - x_min_val
-                if x_range != 0:
-                    time_ratio = (new_time - x_min_val) / x_range
-                    pixel_x_range = x_max_coord - x_min_coord
-                    new_pixel_x = x_min_coord + (time_ratio * pixel_x_range)
+            transform = self.get_calibration_transform()
+            if key in self.selected_points and transform is not None:
+                # Invert the cached real_x = sx * pixel_x + tx mapping used by the table and export
+                sx, tx = transform[0], transform[1]
+                if sx != 0:
+                    new_pixel_x = (new_time - tx) / sx
                     
                     # Keep the same y coordinate (survival rate doesn't change)
                     current_y = self.selected_points[key]['y'] if self.selected_points[key]['y'] is not None else 0
@@ -1809,7 +2162,7 @@ class SurvivalCurveExtractor:
                     
                     # Update display
                     self.update_points_tree()
-                    self.display_image_on_canvas()
+                    self.redraw_overlays()
                     
                     # Auto-save after table edit
                     self.auto_save_current_state()
@@ -1845,7 +2198,7 @@ class SurvivalCurveExtractor:
         
         # Update display
         self.update_points_tree()
-        self.display_image_on_canvas()
+        self.redraw_overlays()
         
         # Auto-save after point deletion
         self.auto_save_current_state()
@@ -1932,7 +2285,7 @@ class SurvivalCurveExtractor:
         
         # Refresh the canvas display
         if self.original_image:
-            self.display_image_on_canvas()
+            self.redraw_overlays()
         
         # Auto-select the newly created point in the tree
         self.select_point_in_tree(group, extra_survival_rate)
@@ -1997,8 +2350,7 @@ class SurvivalCurveExtractor:
         self.group_entries.append({'frame': group_frame, 'entry': entry, 'label': label})
         
         # Update scroll region
-        self.groups_scrollable_frame.update_idletasks()
-        self.groups_canvas.configure(scrollregion=self.groups_canvas.bbox("all"))
+        self.request_groups_scroll_update()
         
         # Don't set any default values - leave empty for user to fill
             
@@ -2028,8 +2380,7 @@ class SurvivalCurveExtractor:
         self.group_entries.append({'frame': group_frame, 'entry': entry, 'label': label})
         
         # Update scroll region
-        self.groups_scrollable_frame.update_idletasks()
-        self.groups_canvas.configure(scrollregion=self.groups_canvas.bbox("all"))
+        self.request_groups_scroll_update()
             
     def remove_group_field(self, frame, entry):
         """Remove a group input field"""
@@ -2044,9 +2395,19 @@ class SurvivalCurveExtractor:
             group_data['label'].config(text=f"Group {i + 1}:")
         
         # Update scroll region and groups
+        self.request_groups_scroll_update()
+        self.update_groups()
+    
+    def request_groups_scroll_update(self):
+        """Schedule one groups scroll region update for when Tk is next idle"""
+        if self._groups_scroll_pending is None:
+            self._groups_scroll_pending = self.root.after_idle(self.flush_groups_scroll_update)
+    
+    def flush_groups_scroll_update(self):
+        """Fit the groups canvas scroll region to the fields added or removed since the last idle point"""
+        self._groups_scroll_pending = None
         self.groups_scrollable_frame.update_idletasks()
         self.groups_canvas.configure(scrollregion=self.groups_canvas.bbox("all"))
-        self.update_groups()
         
     def update_groups(self):
         """Update groups from all entry fields"""
@@ -2090,8 +2451,8 @@ class SurvivalCurveExtractor:
                     self.points_tree.selection_set(first_item[0])
                     self.points_tree.focus(first_item[0])
             
-        # Auto-save after group changes
-        self.auto_save_current_state()
+        # Auto-save after group changes (group names are edited keystroke by keystroke)
+        self.schedule_auto_save()
     
     def populate_all_points(self):
         """Create entries for all group-survival rate combinations and clean up removed groups"""
@@ -2099,13 +2460,11 @@ class SurvivalCurveExtractor:
         current_group_names = set(self.groups)
         keys_to_remove = []
         
-        for key in list(self.selected_points.keys()):
-            # Split key to get group name (everything before the last underscore which is the survival rate)
-            parts = key.split('_')
-            if len(parts) >= 2:
-                group_name = '_'.join(parts[:-1])  # Handle group names that might contain underscores
-                if group_name not in current_group_names:
-                    keys_to_remove.append(key)
+        for key in self.selected_points:
+            # Group name is everything before the last underscore (which precedes the survival rate)
+            group_name, separator, _ = key.rpartition('_')
+            if separator and group_name not in current_group_names:
+                keys_to_remove.append(key)
         
         # Remove points for deleted groups
         for key in keys_to_remove:
@@ -2134,11 +2493,8 @@ class SurvivalCurveExtractor:
                 key = f"{group}_{survival_rate}"
                 if key not in self.selected_points:
                     # Add placeholder point with no coordinates (will show as "N/A")
-                    print(f"Adding missing placeholder point: {key}")
                     self.selected_points[key] = {'x': None, 'y': None}
                     points_added += 1
-                else:
-                    print(f"Preserving existing point: {key}")
         
         if points_added > 0:
             print(f"populate_missing_points: Added {points_added} placeholder points")
@@ -2150,28 +2506,21 @@ class SurvivalCurveExtractor:
         if not self.is_calibrated() or not self.groups:
             return
         
-        # Calculate Y coordinates for each survival rate
-        survival_percentages = [0, 25, 50, 75, 100]  # Convert survival_rates to numeric values
-        survival_y_coords = {}
-        
         # Get calibration values
         y_min_val = self.axis_calibration['y_min']
         y_max_val = self.axis_calibration['y_max']
         y_min_coord = self.axis_calibration['y_min_coord'][1]  # pixel Y of minimum survival
         y_max_coord = self.axis_calibration['y_max_coord'][1]  # pixel Y of maximum survival
         
-        # Calculate pixel Y coordinate for each survival percentage
-        for i, percentage in enumerate(survival_percentages):
-            survival_rate = self.survival_rates[i]  # "0%", "25%", etc.
-            
-            # Linear interpolation between min and max survival coordinates
-            # Note: Y coordinates are flipped (higher survival = lower pixel Y)
-            ratio = percentage / 100.0
-            pixel_y = y_min_coord - (ratio * (y_min_coord - y_max_coord))
-            survival_y_coords[survival_rate] = pixel_y
+        # Pixel Y for each survival rate, interpolated once and shared by every group
+        # Note: Y coordinates are flipped (higher survival = lower pixel Y)
+        y_span = y_min_coord - y_max_coord
+        survival_y_coords = {survival_rate: y_min_coord - fraction * y_span
+                             for survival_rate, fraction in zip(self.survival_rates, self.survival_fractions)}
         
         # Create points for all group-survival rate combinations
         points_added = 0
+        points_updated = 0
         for group in self.groups:
             for survival_rate in self.survival_rates:
                 key = f"{group}_{survival_rate}"
@@ -2182,7 +2531,6 @@ class SurvivalCurveExtractor:
                 # Only add/update if point doesn't exist OR if it's completely empty
                 if existing_point is None:
                     # Point doesn't exist - create new one
-                    print(f"Creating new point: {key}")
                     self.selected_points[key] = {
                         'x': None,  # User needs to click to set time coordinate
                         'y': survival_y_coords[survival_rate]  # Auto-calculated survival coordinate
@@ -2190,33 +2538,33 @@ class SurvivalCurveExtractor:
                     points_added += 1
                 elif existing_point.get('x') is None and existing_point.get('y') is None:
                     # Point exists but is completely empty - add Y coordinate only
-                    print(f"Adding Y coordinate to empty point: {key}")
                     self.selected_points[key]['y'] = survival_y_coords[survival_rate]
+                    points_updated += 1
                 elif existing_point.get('y') is None and existing_point.get('x') is not None:
                     # Point has X but no Y - add Y coordinate
-                    print(f"Adding Y coordinate to point with X: {key}")
                     self.selected_points[key]['y'] = survival_y_coords[survival_rate]
-                else:
-                    # Point already has data - don't touch it
-                    print(f"Preserving existing point: {key} = {existing_point}")
+                    points_updated += 1
+                # Otherwise the point already has data - don't touch it
         
-        print(f"Auto-populate completed: {points_added} points added, total points: {len(self.selected_points)}")
+        print(f"Auto-populate completed: {points_added} points added, {points_updated} given Y coordinates, "
+              f"total points: {len(self.selected_points)}")
         
         if points_added > 0 or True:  # Always update display even if no new points added
             # Update the points tree view
             if hasattr(self, 'points_tree'):
                 self.update_points_tree()
             
-            # Auto-save the populated points
-            self.auto_save_current_state()
+            # Auto-save the populated points (also reached per keystroke via update_groups)
+            self.schedule_auto_save()
         
     def clear_all_groups(self):
         """Clear all group fields"""
         if messagebox.askyesno("Clear All Groups", "Are you sure you want to clear all groups?"):
-            # Clear all entries except the first one
-            while len(self.group_entries) > 1:
-                last_group = self.group_entries[-1]
-                self.remove_group_field(last_group['frame'], last_group['entry'])
+            # Clear all entries except the first one; groups are updated once below
+            for group_data in self.group_entries[1:]:
+                group_data['frame'].destroy()
+            del self.group_entries[1:]
+            self.request_groups_scroll_update()
             
             # Clear the remaining entry
             if self.group_entries:
@@ -2226,11 +2574,14 @@ class SurvivalCurveExtractor:
             
     def run(self):
         """Start the application"""
+        # A ".postN" suffix indicates the Pillow-SIMD build
+        print(f"Using Pillow {PIL.__version__}")
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.root.mainloop()
     
     def select_dataset(self):
         """Select the extraction_data folder containing PNG and metadata"""
+        from tkinter import filedialog
         folder_path = filedialog.askdirectory(title="Select extraction_data folder")
         if folder_path:
             extraction_path = Path(folder_path)
@@ -2238,6 +2589,7 @@ class SurvivalCurveExtractor:
             metadata_path = extraction_path / "metadata"
             
             if png_path.exists() and metadata_path.exists():
+                self.flush_auto_save()
                 self.dataset_path = extraction_path
                 self.load_dataset()
             else:
@@ -2248,12 +2600,16 @@ class SurvivalCurveExtractor:
         """Load all images from the dataset"""
         png_path = self.dataset_path / "png"
         
-        # Get all PNG files and sort them
-        png_files = list(png_path.glob("*.png"))
-        png_files.sort()
-        
-        # Store just the base names (without .png extension)
-        self.image_files = [f.stem for f in png_files]
+        # Get all PNG base names (without .png extension) in one directory pass and sort them
+        self.image_files = []
+        try:
+            with os.scandir(png_path) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.png') and entry.is_file():
+                        self.image_files.append(entry.name[:-4])
+        except OSError as e:
+            print(f"Error reading {png_path}: {e}")
+        self.image_files.sort()
         self.current_index = 0
         
         # Update UI
@@ -2267,6 +2623,18 @@ class SurvivalCurveExtractor:
         if self.image_files:
             self.load_image_by_index(0)
     
+    def scan_json_files(self, folder):
+        """Map the stems of JSON files in a folder to their stat results in one directory pass"""
+        files = {}
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        files[entry.name[:-5]] = entry.stat()
+        except OSError:
+            pass  # Missing folder simply means no files
+        return files
+    
     def undone_all_tasks(self):
         """Clear 'done' status from all result files"""
         if not self.dataset_path:
@@ -2301,8 +2669,7 @@ class SurvivalCurveExtractor:
                     data.pop("error", None)
                     
                     # Save back
-                    with open(result_file, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, default=str)
+                    self.write_json_atomic(result_file, data)
                     
                     cleared_count += 1
                     
@@ -2328,6 +2695,9 @@ class SurvivalCurveExtractor:
     
     def load_image_by_index(self, index, use_filtered=None, preserve_calibration=False):
         """Load image and metadata by index"""
+        # Pending edits belong to the image being left
+        self.flush_auto_save()
+        
         # Set loading flag to prevent auto-save during data loading
         self.loading_in_progress = True
         base_name = None  # Initialize for finally block
@@ -2351,10 +2721,9 @@ class SurvivalCurveExtractor:
                     print(f"No saved data for {base_name} - resetting state")
                     self.reset_for_new_image()
                 else:
-                    # Clear only the UI groups, don't reset calibration/points that might be reloaded
+                    # Clear only the groups, don't reset calibration/points that might be reloaded
                     print(f"Saved data exists for {base_name} - preserving state")
                     self.groups.clear()
-                    self.refresh_groups_ui()
                 
                 # Load PNG image
                 png_path = self.dataset_path / "png" / f"{base_name}.png"
@@ -2368,12 +2737,19 @@ class SurvivalCurveExtractor:
                 # Load metadata only as fallback if no saved data exists
                 self.load_metadata(base_name)
                 
+                # The group fields from the previous image are still up, so this only rewrites
+                # the ones whose names differ (and covers images whose results had no groups)
+                self.refresh_groups_ui()
+                
                 # Update navigation UI
                 self.update_navigation_state()
                 
                 # CRITICAL FIX: Refresh status UI for the newly loaded image
                 self.refresh_status_ui()
                 
+                # Decode the neighbouring images while the user works on this one
+                self.prefetch_neighbors(current_list)
+                
         finally:
             # Always clear loading flag when done
             self.loading_in_progress = False
@@ -2403,10 +2779,9 @@ class SurvivalCurveExtractor:
         self.selected_points.clear()
         self.selected_point_key = None
         
-        # Reset groups (will be restored from metadata or saved data)
+        # Reset groups (will be restored from metadata or saved data). The group fields are
+        # left in place for load_image_by_index to refresh, so they can be reused
         self.groups.clear()
-        # Clear the UI display of groups
-        self.refresh_groups_ui()
         
         # Reset subplot label and notes
         self.subplot_label = ''
@@ -2429,35 +2804,19 @@ class SurvivalCurveExtractor:
             # Try the misspelled version "metatdata"
             metadata_path = self.dataset_path / "metatdata" / f"{base_name}.json"
         
-        # SIMPLE RULE: Check if results file exists - if yes, check each field before populating
-        results_path = self.dataset_path / "results" / f"{base_name}.json"
-        results_data = {}
-        
-        if results_path.exists():
-            try:
-                # Use utf-8-sig to handle files with BOM
-                with open(results_path, 'r', encoding='utf-8-sig') as f:
-                    results_data = json.load(f)
-                print(f"Results file exists for {base_name} - checking fields before metadata population")
-            except Exception as e:
-                print(f"Error reading results file for {base_name}: {e}")
+        # SIMPLE RULE: Saved groups in the results file win over metadata. load_extraction_data()
+        # runs first and records whether the results file had a groups field
+        groups_in_results = getattr(self, '_loaded_from_results', {}).get('groups', False)
         
         if metadata_path.exists():
             try:
-                # Use utf-8-sig to handle files with BOM
-                with open(metadata_path, 'r', encoding='utf-8-sig') as f:
-                    metadata = json.load(f)
-                
-                # Cache metadata
-                self.metadata_cache[base_name] = metadata
+                metadata = self.read_json_file(metadata_path)[1]
                 
                 # Always update image description (doesn't interfere with user data)
                 self.update_image_description(metadata.get('image_description', ''))
                 
                 # Check groups: only populate if groups field doesn't exist in results
                 if 'groups_survival_experiment' in metadata:
-                    groups_in_results = ("metadata" in results_data and "groups" in results_data["metadata"])
-                    
                     if not groups_in_results and not self.groups:
                         metadata_groups = metadata['groups_survival_experiment']
                         if metadata_groups:
@@ -2470,43 +2829,26 @@ class SurvivalCurveExtractor:
                 
             except Exception as e:
                 print(f"Error loading metadata for {base_name}: {e}")
-                self.metadata_cache[base_name] = {}
                 self.update_image_description("Error loading image description.")
         else:
             # No metadata file found
             self.update_image_description("No metadata file found for this image.")
             
         # Clear groups UI only if no groups exist and no groups in results
-        groups_in_results = ("metadata" in results_data and "groups" in results_data["metadata"])
         if not self.groups and not groups_in_results:
             print(f"No groups found for {base_name} - ensuring groups UI is cleared")
             self.refresh_groups_ui()
     
     def auto_populate_groups(self, groups):
         """Auto-populate group entries from metadata"""
-        # Clear existing groups
-        self.groups = []
-        for group_entry in self.group_entries:
-            group_entry['frame'].destroy()
-        self.group_entries = []
-        
-        # Add groups from metadata using silent method to avoid triggering auto-save
-        for group_name in groups:
-            self.add_group_field_silent()
-            # Set the name in the last added entry
-            if self.group_entries:
-                last_entry = self.group_entries[-1]['entry']
-                last_entry.delete(0, tk.END)
-                last_entry.insert(0, group_name)
-        
         # Update the groups list without triggering auto-save during metadata population
         self.groups = []
-        for group_data in self.group_entries:
-            group_name = group_data['entry'].get().strip()
+        for group_name in groups:
+            group_name = str(group_name).strip()
             if group_name:
                 self.groups.append(group_name)
         
-        # Update UI without auto-save
+        # Update UI without auto-save; refresh_groups_ui builds the fields
         self.refresh_groups_ui()
         self.populate_missing_points()
     
@@ -2576,8 +2918,38 @@ class SurvivalCurveExtractor:
         self.update_navigation_state()
     
 
-    def auto_save_current_state(self, status=None, error=None):
+    def schedule_auto_save(self, delay_ms=500):
+        """Save the current state once edits have paused for delay_ms"""
+        if self.loading_in_progress:
+            return  # Same as auto_save_current_state: state being loaded is not an edit
+        if self._auto_save_pending is not None:
+            self.root.after_cancel(self._auto_save_pending)
+        # Bind the save to the image being edited now, not whichever is current when it fires
+        current_list = self.get_current_image_list()
+        if 0 <= self.current_index < len(current_list):
+            self._auto_save_target = current_list[self.current_index]
+        self._auto_save_pending = self.root.after(delay_ms, self.flush_auto_save)
+    
+    def flush_auto_save(self):
+        """Run a scheduled auto-save now, before the current image or dataset changes"""
+        if self._auto_save_pending is not None:
+            self.auto_save_current_state(base_name=self._auto_save_target)
+    
+    def auto_save_current_state(self, status=None, error=None, base_name=None):
         """Automatically save the current extraction state"""
+        # Same image list schedule_auto_save binds against, so the names compare equal
+        current_list = self.get_current_image_list()
+        if base_name is None and 0 <= self.current_index < len(current_list):
+            base_name = current_list[self.current_index]
+        
+        # Any scheduled save is covered by this one, unless it was bound to another image
+        if self._auto_save_pending is not None:
+            self.root.after_cancel(self._auto_save_pending)
+            self._auto_save_pending = None
+            target, self._auto_save_target = self._auto_save_target, None
+            if target and target != base_name:
+                self.auto_save_current_state(base_name=target)
+        
         if not self.auto_save_enabled or not self.dataset_path or not self.image_files:
             print("Auto-save skipped: not enabled or missing dataset/images")
             return
@@ -2586,13 +2958,12 @@ class SurvivalCurveExtractor:
             print("Auto-save skipped: loading in progress")
             return
             
-        if self.current_index >= len(self.image_files):
+        if base_name is None:
             print("Auto-save skipped: invalid current index")
             return
             
-        current_file = self.image_files[self.current_index]
-        print(f"Auto-saving: {current_file}")
-        self.save_extraction_data(current_file, status=status, error=error)
+        print(f"Auto-saving: {base_name}")
+        self.save_extraction_data(base_name, status=status, error=error)
     
     def auto_save_current_state_clear_status(self):
         """Save current state and clear status/error"""
@@ -2604,11 +2975,12 @@ class SurvivalCurveExtractor:
             print("Auto-save skipped: loading in progress")
             return
             
-        if self.current_index >= len(self.image_files):
+        current_list = self.get_current_image_list()
+        if self.current_index >= len(current_list):
             print("Auto-save skipped: invalid current index")
             return
             
-        current_file = self.image_files[self.current_index]
+        current_file = current_list[self.current_index]
         print(f"Auto-saving with cleared status: {current_file}")
         self.save_extraction_data_clear_status(current_file)
     
@@ -2622,22 +2994,58 @@ class SurvivalCurveExtractor:
             # First, save the latest points/metadata
             self.save_extraction_data(base_name)
 
-            # Then remove status/error
+            # Then remove status/error, rewriting only if either is present
             data = {}
             if result_file.exists():
-                with open(result_file, 'r', encoding='utf-8-sig') as f:
-                    data = json.load(f)
-            data.pop("status", None)
-            data.pop("error", None)
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, default=str)
+                data = self.read_json_file(result_file)[1]
+            if "status" in data or "error" in data or not result_file.exists():
+                data.pop("status", None)
+                data.pop("error", None)
+                self.write_json_atomic(result_file, data)
 
             print(f"CLEAR: Removed status/error for {base_name}")
         except Exception as e:
             print(f"CLEAR: Failed to clear status for {base_name}: {e}")
 
-    def parse_point_key(self, key):
-        """Parse a point key into group and survival_rate
+    def read_json_file(self, path):
+        """Return (text, parsed data) for a JSON file, reusing the last read text while its mtime and size match"""
+        stat_result = os.stat(path)
+        stamp = (stat_result.st_mtime_ns, stat_result.st_size)
+        cached = self._json_text_cache.get(path)
+        if cached and cached[0] == stamp:
+            text = cached[1]
+            self._json_text_cache.move_to_end(path)
+        else:
+            # Use utf-8-sig to handle files with BOM
+            with open(path, 'r', encoding='utf-8-sig') as f:
+                text = f.read()
+            self.store_json_text(path, stamp, text)
+        # Parse on every call so callers can keep and mutate what they get
+        return text, json.loads(text)
+    
+    def write_json_atomic(self, path, data):
+        """Write JSON to a temp file and swap it in with os.replace so a crash never leaves a torn file"""
+        payload = json.dumps(data, indent=2, default=str)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+        
+        # The next read of this file (e.g. the following save's merge) needs no disk access
+        stat_result = os.stat(path)
+        self.store_json_text(path, (stat_result.st_mtime_ns, stat_result.st_size), payload)
+    
+    def store_json_text(self, path, stamp, text):
+        """Remember a JSON file's text, evicting the least recently used files beyond the cache size"""
+        self._json_text_cache[path] = (stamp, text)
+        self._json_text_cache.move_to_end(path)
+        if len(self._json_text_cache) > self._json_text_cache_size:
+            self._json_text_cache.popitem(last=False)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse_point_key(key):
+        """Parse a point key into group and survival_rate (memoized; keys recur on every refresh and save)
         
         Handles keys like:
         - "WT_25%" -> ("WT", "25%")
@@ -2681,7 +3089,7 @@ class SurvivalCurveExtractor:
         
         # Last resort fallback
         if '_' in key:
-            return key.rsplit('_', 1)
+            return tuple(key.rsplit('_', 1))
         return key, ""
     
     def save_extraction_data(self, base_name, status=None, error=None):
@@ -2692,11 +3100,11 @@ class SurvivalCurveExtractor:
 
             result_file = results_path / f"{base_name}.json"
             existing_data = {}
+            existing_text = None
 
             if result_file.exists():
                 try:
-                    with open(result_file, 'r', encoding='utf-8-sig') as f:
-                        existing_data = json.load(f)
+                    existing_text, existing_data = self.read_json_file(result_file)
                     print(f"SAVE: Found existing results file for {base_name} - preserving existing data")
                 except Exception as e:
                     print(f"SAVE: Could not load existing data for {base_name}: {e}")
@@ -2707,6 +3115,7 @@ class SurvivalCurveExtractor:
 
             # ---- metadata ----
             md = save_data.get("metadata", {})
+            previous_date = md.get("extraction_date")
             md["image_file"] = f"{base_name}.png"
             md["extraction_date"] = self.get_current_timestamp()
 
@@ -2748,6 +3157,8 @@ class SurvivalCurveExtractor:
 
             cal = md.get("calibration", {})
             cal_ok = _cal_ready(cal)
+            # Resolve the pixel-to-time coefficients once rather than per point
+            x_coefficients = self.x_calibration_coefficients(cal) if cal_ok else None
 
             # Update only the points we currently know about; leave everything else intact
             for key, coord in (self.selected_points or {}).items():
@@ -2763,15 +3174,9 @@ class SurvivalCurveExtractor:
 
                     # Compute calibrated x if possible; else store None (but keep raw)
                     time_value = None
-                    if cal_ok and coord is not None:
-                        # You may have your own calibrator; pick the most accurate available
-                        if hasattr(self, "pixel_to_real_x_with_calibration"):
-                            px = coord["x"] if isinstance(coord, dict) else coord[0]
-                            time_value = self.pixel_to_real_x_with_calibration(px, cal)
-                        elif hasattr(self, "pixel_to_time"):
-                            px = coord["x"] if isinstance(coord, dict) else coord[0]
-                            time_value = self.pixel_to_time(px)
-                        # else: leave as None
+                    if x_coefficients is not None and coord is not None:
+                        px = coord["x"] if isinstance(coord, dict) else coord[0]
+                        time_value = x_coefficients[0] * px + x_coefficients[1]
 
                     extracted_points[survival_rate][group] = time_value
 
@@ -2803,8 +3208,17 @@ class SurvivalCurveExtractor:
             else:
                 save_data.pop("error", None)
 
-            with open(result_file, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, indent=2, default=str)
+            # Skip the write when nothing but the extraction timestamp would change
+            if existing_text is not None and previous_date is not None:
+                new_date = md["extraction_date"]
+                md["extraction_date"] = previous_date
+                unchanged = json.dumps(save_data, indent=2, default=str) == existing_text
+                md["extraction_date"] = new_date
+                if unchanged:
+                    print(f"SAVE: No changes for {base_name} - skipped write")
+                    return
+
+            self.write_json_atomic(result_file, save_data)
 
             print(f"SAVE: Wrote {base_name} (status={save_data.get('status')}, error={'present' if 'error' in save_data else 'none'})")
 
@@ -2814,23 +3228,22 @@ class SurvivalCurveExtractor:
     def cleanup_removed_groups(self):
         """Remove data points for groups that no longer exist"""
         keys_to_remove = []
+        removed_groups = set()
         current_group_names = set(self.groups)
         
-        for key in list(self.selected_points.keys()):
+        for key in self.selected_points:
             try:
                 group, survival_rate = self.parse_point_key(key)
                 # If the group is no longer in the current groups list, mark for removal
                 if group not in current_group_names:
                     keys_to_remove.append(key)
+                    removed_groups.add(group)
             except (ValueError, IndexError):
                 continue
         
         # Remove the obsolete keys
         if keys_to_remove:
-            removed_groups = set()
             for key in keys_to_remove:
-                group, _ = self.parse_point_key(key)
-                removed_groups.add(group)
                 del self.selected_points[key]
             
             print(f"Cleaned up {len(keys_to_remove)} points from {len(removed_groups)} removed groups: {', '.join(sorted(removed_groups))}")
@@ -2839,8 +3252,8 @@ class SurvivalCurveExtractor:
             if hasattr(self, 'points_tree'):
                 self.update_points_tree()
             
-            # Auto-save after cleanup
-            self.auto_save_current_state()
+            # Auto-save after cleanup (also reached per keystroke via update_groups)
+            self.schedule_auto_save()
     
     def handle_group_rename(self, old_groups, new_groups):
         """Handle group renaming by updating point keys"""
@@ -2887,9 +3300,7 @@ class SurvivalCurveExtractor:
             results_path = self.dataset_path / "results" / f"{base_name}.json"
             
             if results_path.exists():
-                # Use utf-8-sig to handle files with BOM
-                with open(results_path, 'r', encoding='utf-8-sig') as f:
-                    data = json.load(f)
+                data = self.read_json_file(results_path)[1]
                 
                 # Restore groups if saved (priority over metadata)
                 if "metadata" in data and "groups" in data["metadata"]:
@@ -2950,7 +3361,7 @@ class SurvivalCurveExtractor:
                     loaded_data['points'] = True
                     if hasattr(self, 'points_tree'):
                         self.update_points_tree()
-                    self.display_image_on_canvas()
+                    self.redraw_overlays()
                     print(f"Loaded {len(self.selected_points)} existing points from saved data")
                 
                 # Only auto-populate points if calibration exists AND no points were loaded
@@ -2993,7 +3404,6 @@ class SurvivalCurveExtractor:
     
     def get_current_timestamp(self):
         """Get current timestamp in ISO format"""
-        from datetime import datetime
         return datetime.now().isoformat()
     
     def is_calibrated(self):
@@ -3015,8 +3425,8 @@ class SurvivalCurveExtractor:
             calibration.get('y_min_coord'), calibration.get('y_max_coord')
         ])
     
-    def pixel_to_real_x_with_calibration(self, pixel_x, calibration):
-        """Convert pixel X coordinate to real X axis value using specific calibration"""
+    def x_calibration_coefficients(self, calibration):
+        """Return (scale, offset) so that real_x = scale * pixel_x + offset, or None if not calibrated"""
         if not self.is_calibration_data_complete(calibration):
             return None
             
@@ -3025,41 +3435,25 @@ class SurvivalCurveExtractor:
         x_min_val = calibration['x_min']
         x_max_val = calibration['x_max']
         
-        # Linear interpolation
-        x_range = x_max_val - x_min_val
+        # Linear interpolation, folded into a single multiply-add per point
         pixel_x_range = x_max_coord - x_min_coord
-        
         if pixel_x_range == 0:
-            return x_min_val
-            
-        # Calculate position as ratio and interpolate
-        ratio = (pixel_x - x_min_coord) / pixel_x_range
-        real_x = x_min_val + (ratio * x_range)
+            return 0.0, x_min_val
         
-        return real_x
+        scale = (x_max_val - x_min_val) / pixel_x_range
+        return scale, x_min_val - x_min_coord * scale
     
-    def pixel_to_real_x(self, pixel_x):
-        """Convert pixel X coordinate to real X axis value"""
-        if not self.is_calibrated():
+    def pixel_to_real_x_with_calibration(self, pixel_x, calibration):
+        """Convert pixel X coordinate to real X axis value using specific calibration"""
+        coefficients = self.x_calibration_coefficients(calibration)
+        if coefficients is None:
             return None
-            
-        x_min_coord = self.axis_calibration['x_min_coord'][0]  # x coordinate of min point
-        x_max_coord = self.axis_calibration['x_max_coord'][0]  # x coordinate of max point
-        x_min_val = self.axis_calibration['x_min']
-        x_max_val = self.axis_calibration['x_max']
-        
-        # Linear interpolation
-        x_range = x_max_val - x_min_val
-        pixel_x_range = x_max_coord - x_min_coord
-        
-        if pixel_x_range == 0:
-            return x_min_val
-            
-        ratio = (pixel_x - x_min_coord) / pixel_x_range
-        real_x = x_min_val + (ratio * x_range)
-        
-        return real_x
+        scale, offset = coefficients
+        return scale * pixel_x + offset
     
+    def pixel_to_real_x(self, pixel_x):
+        """Convert pixel X coordinate to real X axis value"""
+        return self.pixel_to_real_x_with_calibration(pixel_x, self.axis_calibration)
     
     def zoom_in(self):
         """Zoom in on the image"""
@@ -3101,14 +3495,27 @@ class SurvivalCurveExtractor:
             if hasattr(self, 'zoom_label'):
                 self.zoom_label.config(text=f"{int(self.zoom_level * 100)}%")
             
-            # Redisplay image if it exists
+            # Redisplay image once the current burst of zoom steps has been processed
             if hasattr(self, 'original_image') and self.original_image:
-                self.display_image_on_canvas()
+                self.request_redraw()
         except Exception as e:
             print(f"Error updating zoom: {e}")
         finally:
             self._updating_zoom = False
     
+    def request_redraw(self):
+        """Schedule a single display_image_on_canvas() for when Tk is next idle"""
+        if self._redraw_pending is None:
+            self._redraw_pending = self.root.after_idle(self.flush_redraw)
+    
+    def flush_redraw(self):
+        """Run the redraw requested since the last idle point"""
+        self._redraw_pending = None
+        try:
+            self.display_image_on_canvas()
+        except Exception as e:
+            print(f"Error redrawing image: {e}")
+    
     def on_canvas_release(self, event):
         """Handle mouse button release"""
         # Handle calibration point release
@@ -3123,15 +3530,20 @@ class SurvivalCurveExtractor:
             self.zoom_out()
     
     def on_canvas_configure(self, event):
+        """Coalesce bursts of canvas resize events during window dragging"""
+        if self._configure_pending is None:
+            self._configure_pending = self.root.after(50, self.flush_canvas_configure)
+    
+    def flush_canvas_configure(self):
         """Handle canvas resize to update scrollbar visibility"""
+        self._configure_pending = None
         if self.original_image and hasattr(self, 'canvas_image'):
             # Get current image dimensions
             img_width, img_height = self.original_image.size
             
             # Apply current zoom level
-            base_scale = min((self.canvas.winfo_width() - 50) / img_width,
-                           (self.canvas.winfo_height() - 50) / img_height, 1.0)
-            scale_factor = base_scale * self.zoom_level
+            scale_factor = self.fit_scale(self.original_image.size, self.canvas.winfo_width(),
+                                          self.canvas.winfo_height(), self.zoom_level)
             
             new_width = int(img_width * scale_factor)
             new_height = int(img_height * scale_factor)
@@ -3170,6 +3582,7 @@ class SurvivalCurveExtractor:
         
         if self.zoom_window:
             self.zoom_window.destroy()
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
         self.root.destroy()
 
 
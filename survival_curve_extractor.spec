@@ -1,4 +1,5 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
 
 a = Analysis(
     ['main.py'],
@@ -25,7 +26,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=os.environ.get('SCE_NO_UPX') != '1',  # build.py --no-upx: faster build, larger executable
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,  # No console window